@@ -5,6 +5,8 @@ set TEMP_DIR=%~dp0build_env
 set PY_DIR=%~dp0python_runtime
 set PY_VERSION=3.11.6
 set PY_URL=https://www.python.org/ftp/python/%PY_VERSION%/python-%PY_VERSION%-amd64.exe
+rem Reuse downloaded wheels between builds (PIP_INDEX_URL is honoured by pip as usual)
+if not defined PIP_CACHE_DIR set PIP_CACHE_DIR=%~dp0.pip-cache
 
 if not exist "%PY_DIR%\python.exe" (
     if exist "%TEMP_DIR%" rmdir /S /Q "%TEMP_DIR%"
@@ -17,14 +19,29 @@ if not exist "%PY_DIR%\python.exe" (
     echo Using existing Python in %PY_DIR%...
 )
 
-echo Installing PyInstaller...
-"%PY_DIR%\python.exe" -m pip install --upgrade pip pyinstaller >nul
+rem The bundled pip is recent enough; set PDS_UPGRADE_PIP=1 to upgrade it anyway
+if "%PDS_UPGRADE_PIP%"=="1" (
+    echo Upgrading pip...
+    "%PY_DIR%\python.exe" -m pip install --disable-pip-version-check --no-input --cache-dir "%PIP_CACHE_DIR%" --upgrade pip >nul
+)
+
+rem Starting pip is slow, so PyInstaller is only installed when it is missing
+"%PY_DIR%\python.exe" -c "import PyInstaller" >nul 2>&1
+if errorlevel 1 (
+    echo Installing PyInstaller...
+    "%PY_DIR%\python.exe" -m pip install --disable-pip-version-check --no-input --cache-dir "%PIP_CACHE_DIR%" pyinstaller >nul
+) else (
+    echo Using installed PyInstaller...
+)
 
 echo Building launcher.exe...
-"%PY_DIR%\python.exe" -m PyInstaller launcher.py --onefile --noconsole --name launcher
+rem --onedir avoids unpacking the whole bundle to %%TEMP%% on every start
+"%PY_DIR%\python.exe" -m PyInstaller launcher.py --onedir --noconsole --name launcher
 
-if exist dist\launcher.exe (
-    copy dist\launcher.exe launcher.exe >nul
+if exist dist\launcher\launcher.exe (
+    if exist _internal rmdir /S /Q _internal
+    move /Y dist\launcher\launcher.exe launcher.exe >nul
+    move /Y dist\launcher\_internal _internal >nul
     echo launcher.exe created.
 ) else (
     echo Build failed.
@@ -22,6 +22,32 @@ BASE_URL = f"https://www.python.org/ftp/python/{PYTHON_VERSION}/"
 # Place the downloaded Python runtime next to the executable/launcher script.
 BASE_DIR = Path(sys.argv[0]).resolve().parent
 PYTHON_DIR = BASE_DIR / "python_runtime"
+# Downloaded installers are kept here so reinstalling the runtime (e.g. after
+# ``python_runtime`` was removed) does not download them again.
+CACHE_DIR = Path.home() / ".pds_generator" / "cache"
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _download(url: str, target: Path, progress: ttk.Progressbar, root: tk.Tk) -> None:
+    """Download ``url`` into ``target`` updating ``progress`` per chunk.
+
+    Data is written to a ``.part`` file first so that an interrupted download
+    is never mistaken for a complete cached file.
+    """
+    part = target.with_name(target.name + ".part")
+    with urllib.request.urlopen(url) as resp, open(part, "wb") as fh:
+        total = int(resp.headers.get("Content-Length") or 0)
+        done = 0
+        while True:
+            chunk = resp.read(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            fh.write(chunk)
+            done += len(chunk)
+            if total > 0:
+                progress["value"] = done * 100 // total
+                root.update()
+    part.replace(target)
 
 
 def _ensure_windows_python() -> Path:
@@ -30,8 +56,10 @@ def _ensure_windows_python() -> Path:
     if python_exe.exists():
         return python_exe
     PYTHON_DIR.mkdir(exist_ok=True)
-    installer = PYTHON_DIR / "python-installer.exe"
-    url = BASE_URL + f"python-{PYTHON_VERSION}-amd64.exe"
+    # The installer URL is pinned to an exact release, so a cached copy never
+    # goes stale and can be reused without asking the server.
+    installer = CACHE_DIR / f"python-{PYTHON_VERSION}-amd64.exe"
+    url = BASE_URL + installer.name
 
     root = tk.Tk()
     root.title("PDS Generator")
@@ -41,13 +69,9 @@ def _ensure_windows_python() -> Path:
     progress.pack(padx=20, pady=(0, 20))
     root.update()
 
-    def reporthook(blocknum: int, blocksize: int, totalsize: int) -> None:
-        if totalsize > 0:
-            percent = blocknum * blocksize * 100 // totalsize
-            progress["value"] = percent
-            root.update()
-
-    urllib.request.urlretrieve(url, installer, reporthook)
+    if not installer.exists():
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _download(url, installer, progress, root)
 
     label.config(text="Instalowanie Pythona...")
     progress.config(mode="indeterminate")
@@ -75,7 +99,6 @@ def _ensure_windows_python() -> Path:
         time.sleep(1)
     else:
         raise RuntimeError("Nie można odnaleźć python.exe po instalacji")
-    installer.unlink(missing_ok=True)
     return python_exe
 
 
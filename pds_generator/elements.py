@@ -1,14 +1,326 @@
+import hashlib
 import logging
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 
 import pandas as pd
-import requests
 from PIL import Image, ImageTk, UnidentifiedImageError
 import tkinter as tk
 from tkinter import font as tkfont
 
 logger = logging.getLogger(__name__)
 
+# Minimum time between two handled pointer motion events (~120 Hz).
+MOVE_INTERVAL_MS = 8
+# Canvas tag shared by all items of the elements being dragged.
+DRAG_TAG = "dragged"
+
+# Tags of the element body (rectangle, label, image) and resize handle items.
+# Event bindings are made once per canvas on these tags and dispatched to the
+# element owning the item under the pointer.
+BODY_TAG = "element"
+HANDLE_TAG = "element_handle"
+
+
+def _element_items(canvas):
+    """Return the ``item id -> element`` map of ``canvas``.
+
+    The shared tag bindings are installed the first time a canvas is used.
+    """
+    items = getattr(canvas, "_element_items", None)
+    if items is None:
+        items = canvas._element_items = {}
+
+        def dispatch(method):
+            def handler(event):
+                current = canvas.find_withtag("current")
+                element = items.get(current[0]) if current else None
+                if element is not None:
+                    return getattr(element, method)(event)
+
+            return handler
+
+        for tag, press, motion, release in (
+            (BODY_TAG, "start_move", "moving", "stop_move"),
+            (HANDLE_TAG, "start_resize", "resizing", "stop_resize"),
+        ):
+            canvas.tag_bind(tag, "<ButtonPress-1>", dispatch(press))
+            canvas.tag_bind(tag, "<B1-Motion>", dispatch(motion))
+            canvas.tag_bind(tag, "<ButtonRelease-1>", dispatch(release))
+            canvas.tag_bind(tag, "<Button-3>", dispatch("show_menu"))
+    return items
+
+
+def _snap(value, step, inv_step):
+    """Round ``value`` to a multiple of ``step`` (``inv_step`` is ``1 / step``).
+
+    ``step`` follows the zoom and is usually a float, so this multiplies by
+    a precomputed reciprocal instead of dividing for every coordinate. Ties
+    round to even, like the group and canvas snapping.
+    """
+    return round(value * inv_step) * step
+
+
+def stack_by_layer(canvas, elements):
+    """Raise the items of ``elements`` layer by layer, lowest layer first.
+
+    Every element's items carry a ``layer<n>`` tag, so this is one
+    ``tag_raise`` per distinct layer rather than one per canvas item. The
+    canvas remembers the elements and layers it last stacked; when those are
+    unchanged nothing is raised and ``False`` is returned.
+    """
+    order = tuple((el, el.layer) for el in elements)
+    if order == getattr(canvas, "_layer_order", None):
+        return False
+    canvas._layer_order = order
+    layers = set()
+    for el, layer in order:
+        el._apply_layer_tag()
+        layers.add(layer)
+    for layer in sorted(layers):
+        canvas.tag_raise(f"layer{layer}")
+    return True
+
+
+def forget_stacking(canvas):
+    """Make the next ``stack_by_layer`` on ``canvas`` restack everything.
+
+    Called whenever canvas items are created or deleted: new items land on
+    top of the display list, so an unchanged element/layer order no longer
+    means the canvas is stacked correctly.
+    """
+    canvas._layer_order = None
+
+
+# Measuring fonts reused by ``fit_text``, keyed by ``(family, weight)``.
+_FONT_CACHE = {}
+
+
+def _get_font(family, weight):
+    key = (family, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = tkfont.Font(family=family, size=1, weight=weight)
+    return font
+
+
+# Label fonts shared by all elements, keyed by ``(family, size, weight)``.
+_LABEL_FONTS = {}
+
+
+def _get_label_font(family, size, weight):
+    key = (family, size, weight)
+    font = _LABEL_FONTS.get(key)
+    if font is None:
+        font = _LABEL_FONTS[key] = tkfont.Font(family=family, size=size, weight=weight)
+    return font
+
+
+@lru_cache(maxsize=4096)
+def _measure(family, size, weight, text):
+    """Return ``(width, linespace)`` of ``text`` in pixels.
+
+    Elements often share the same text and style, so the Tcl measuring calls
+    are memoised across all of them.
+    """
+    font = _get_font(family, weight)
+    font.configure(size=size)
+    return font.measure(text), font.metrics("linespace")
+
+
+# Remote images are downloaded in the background so that a slow server does
+# not freeze the editor; the raw bytes of recent downloads are kept in memory.
+REMOTE_CACHE_SIZE = 64
+# How often the Tk thread checks whether a background download has finished.
+REMOTE_POLL_MS = 50
+_remote_cache = OrderedDict()
+_remote_lock = threading.Lock()
+_fetch_pool = None
+_http_session = None
+
+
+def _get_fetch_pool():
+    global _fetch_pool, _http_session
+    with _remote_lock:
+        if _fetch_pool is None:
+            import requests
+
+            _http_session = requests.Session()
+            _fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-fetch")
+    return _fetch_pool
+
+
+def _cached_remote(url):
+    with _remote_lock:
+        data = _remote_cache.get(url)
+        if data is not None:
+            _remote_cache.move_to_end(url)
+        return data
+
+
+def _fetch_remote(url):
+    resp = _http_session.get(url, timeout=5)
+    resp.raise_for_status()
+    data = resp.content
+    with _remote_lock:
+        _remote_cache[url] = data
+        _remote_cache.move_to_end(url)
+        while len(_remote_cache) > REMOTE_CACHE_SIZE:
+            _remote_cache.popitem(last=False)
+    return data
+
+
+# Large local images are decoded once and kept as downscaled PNG copies so
+# previewing further rows does not decode the full-size originals again.
+THUMB_DIR = os.path.join(os.path.expanduser("~"), ".pds_generator", "thumbs")
+THUMB_MAX_SIZE = 1024
+THUMB_CACHE_BYTES = 200 * 1024 * 1024
+
+
+def _thumb_path(path, st):
+    key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}".encode("utf-8")
+    return os.path.join(THUMB_DIR, hashlib.sha1(key).hexdigest() + ".png")
+
+
+def _prune_thumbs():
+    """Remove the least recently used thumbnails above the size limit."""
+    entries = []
+    total = 0
+    with os.scandir(THUMB_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".png"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+    if total <= THUMB_CACHE_BYTES:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= THUMB_CACHE_BYTES * 0.8:
+            break
+
+
+def _open_local_image(path):
+    """Open ``path`` for display, using a cached thumbnail for big images."""
+    st = os.stat(path)
+    thumb = _thumb_path(path, st)
+    try:
+        img = Image.open(thumb)
+        img.load()
+        os.utime(thumb)  # mark as recently used for pruning
+        return img
+    except OSError:
+        pass
+    img = Image.open(path)
+    if max(img.size) <= THUMB_MAX_SIZE:
+        return img
+    img.thumbnail((THUMB_MAX_SIZE, THUMB_MAX_SIZE), Image.LANCZOS)
+    try:
+        os.makedirs(THUMB_DIR, exist_ok=True)
+        tmp = f"{thumb}.tmp"
+        img.save(tmp, "PNG")
+        os.replace(tmp, thumb)
+        _prune_thumbs()
+    except (OSError, ValueError) as err:  # pragma: no cover - best effort logging
+        logger.debug("Failed to cache thumbnail for %s: %s", path, err)
+    return img
+
+
+class GuideIndex:
+    """Edges of the items a dragged element can align with, sorted.
+
+    The index is built once when a drag starts; each motion event then only
+    looks at the edges within the snapping tolerance (found with ``bisect``)
+    instead of comparing against every other item.
+    """
+
+    def __init__(self, items):
+        xs = []
+        ys = []
+        for order, item in enumerate(items):
+            xs.append((item.x, order, 0, item))
+            xs.append((item.x + item.width, order, 1, item))
+            ys.append((item.y, order, 0, item))
+            ys.append((item.y + item.height, order, 1, item))
+        xs.sort(key=lambda e: e[0])
+        ys.sort(key=lambda e: e[0])
+        self._xs, self._x_keys = xs, [e[0] for e in xs]
+        self._ys, self._y_keys = ys, [e[0] for e in ys]
+
+    @staticmethod
+    def _match(entries, keys, edges, tol):
+        # when several edges are in range the earliest item wins, then the
+        # earliest of ``edges`` and the item's near edge before its far one
+        best = None
+        for rank, value in enumerate(edges):
+            lo = bisect_left(keys, value - tol)
+            hi = bisect_right(keys, value + tol)
+            for coord, order, side, item in entries[lo:hi]:
+                key = (order, rank, side)
+                if best is None or key < best[0]:
+                    best = (key, coord - value, coord, item)
+        return best[1:] if best else None
+
+    def match_x(self, edges, tol):
+        """Return ``(snap offset, edge x, item)`` for the closest match or ``None``."""
+        return self._match(self._xs, self._x_keys, edges, tol)
+
+    def match_y(self, edges, tol):
+        """Return ``(snap offset, edge y, item)`` for the closest match or ``None``."""
+        return self._match(self._ys, self._y_keys, edges, tol)
+
+
+class MotionThrottle:
+    """Coalesce pointer motion events to at most one call per ``interval`` ms.
+
+    High polling rate mice deliver far more ``<B1-Motion>`` events than can be
+    drawn. Events arriving too soon after the last handled one are kept and
+    the newest of them is delivered from an idle callback, so the final
+    pointer position is never lost.
+    """
+
+    def __init__(self, widget, callback, interval=MOVE_INTERVAL_MS):
+        self.widget = widget
+        self.callback = callback
+        self.interval = interval
+        self._last_time = None
+        self._pending = None
+        self._after_id = None
+
+    def __call__(self, event):
+        if self._last_time is not None and 0 <= event.time - self._last_time < self.interval:
+            self._pending = event
+            if self._after_id is None:
+                self._after_id = self.widget.after_idle(self.flush)
+            return
+        self._pending = None
+        self._last_time = event.time
+        self.callback(event)
+
+    def flush(self):
+        """Deliver the pending event now; used when the drag ends."""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        event, self._pending = self._pending, None
+        if event is not None:
+            self._last_time = event.time
+            self.callback(event)
+
+
 class DraggableElement:
     """Representation of a draggable/resizable item on the configuration canvas."""
 
@@ -33,6 +345,32 @@ class DraggableElement:
         self.align = "left"
         # layering (1-based, 0 reserved for page background)
         self.layer = max((el.layer for el in parent.elements.values()), default=0) + 1
+        # image shown instead of the text label; the canvas item is kept for
+        # the element's lifetime and hidden while the value is plain text
+        self.image_id = None
+        # every canvas item of the element, fixed once the items are created
+        self.canvas_items = ()
+        self.image_obj = None
+        self.raw_image = None
+        self._move_throttle = MotionThrottle(canvas, self._move_to)
+        self._resize_throttle = MotionThrottle(canvas, self._resize_to)
+        # True while the user drags the resize handle
+        self._interactive = False
+        # (text, box, font) of the last ``fit_text`` run and the size it chose
+        self._last_fit = None
+        # (family, size, weight) currently configured on the label
+        self._font_key = None
+        self._guides_after = None
+        # ``layer<n>`` tag currently set on the element's items
+        self._layer_tag = None
+        # elements moved by the current drag, captured in ``start_move``
+        self._drag_elements = ()
+        # (size, mode, resample filter) the displayed image was rendered with;
+        # ``PhotoImage.paste`` converts to the photo's mode, so it is only
+        # reused for images of the same size and mode
+        self._image_render = None
+        # identifies the remote image download the element is waiting for
+        self._fetch_token = None
         self._create_items()
 
     # ------------------------------------------------------------------
@@ -44,36 +382,64 @@ class DraggableElement:
             self.y + self.height,
             fill=self.bg_color,
             outline="black",
+            tags=(BODY_TAG,),
+        )
+        self.label = self.canvas.create_text(
+            0, 0, text=self.text, fill=self.text_color, tags=(BODY_TAG,)
+        )
+        self.image_id = self.canvas.create_image(
+            self.x, self.y, anchor="nw", state="hidden", tags=(BODY_TAG,)
         )
-        self.label = self.canvas.create_text(0, 0, text=self.text, fill=self.text_color)
         self.handle = self.canvas.create_rectangle(
             self.x + self.width - self.HANDLE_SIZE,
             self.y + self.height - self.HANDLE_SIZE,
             self.x + self.width,
             self.y + self.height,
             fill="black",
+            tags=(HANDLE_TAG,),
         )
-
-        # Bind events for dragging and resizing
-        self.canvas.tag_bind(self.rect, "<ButtonPress-1>", self.start_move)
-        self.canvas.tag_bind(self.rect, "<B1-Motion>", self.moving)
-        self.canvas.tag_bind(self.rect, "<ButtonRelease-1>", self.stop_move)
-        self.canvas.tag_bind(self.label, "<ButtonPress-1>", self.start_move)
-        self.canvas.tag_bind(self.label, "<B1-Motion>", self.moving)
-        self.canvas.tag_bind(self.label, "<ButtonRelease-1>", self.stop_move)
-        self.canvas.tag_bind(self.handle, "<ButtonPress-1>", self.start_resize)
-        self.canvas.tag_bind(self.handle, "<B1-Motion>", self.resizing)
-        self.canvas.tag_bind(self.handle, "<ButtonRelease-1>", self.stop_resize)
+        self.canvas_items = (self.rect, self.label, self.image_id, self.handle)
+        # dragging, resizing and the context menu are bound on the shared tags
+        items = _element_items(self.canvas)
+        for item in self.canvas_items:
+            items[item] = self
+        forget_stacking(self.canvas)
         # Context menu for layering
         self.menu = tk.Menu(self.canvas, tearoff=0)
         self.menu.add_command(label="Przenieś warstwę +1", command=self.raise_layer)
         self.menu.add_command(label="Przenieś warstwę -1", command=self.lower_layer)
-        self.canvas.tag_bind(self.rect, "<Button-3>", self.show_menu)
-        self.canvas.tag_bind(self.label, "<Button-3>", self.show_menu)
-        self.canvas.tag_bind(self.handle, "<Button-3>", self.show_menu)
         self.apply_font()
         self.fit_text()
         self._update_label_position()
+        self._geometry_changed()
+
+    def _geometry_changed(self):
+        # lets the editor drop cached group membership
+        if hasattr(self.parent, "geometry_changed"):
+            self.parent.geometry_changed()
+
+    def _apply_layer_tag(self):
+        tag = f"layer{self.layer}"
+        if tag == self._layer_tag:
+            return
+        for item in self.canvas_items:
+            if self._layer_tag:
+                self.canvas.dtag(item, self._layer_tag)
+            self.canvas.addtag_withtag(tag, item)
+        self._layer_tag = tag
+
+    def destroy(self):
+        """Remove the element's canvas items and context menu."""
+        self._geometry_changed()
+        items = _element_items(self.canvas)
+        for item in self.canvas_items:
+            items.pop(item, None)
+            self.canvas.delete(item)
+        forget_stacking(self.canvas)
+        self.image_obj = None
+        self.raw_image = None
+        self._fetch_token = None
+        self.menu.destroy()
 
     # ------------------------------------------------------------------
     def show_menu(self, event):
@@ -81,7 +447,7 @@ class DraggableElement:
 
     def raise_layer(self):
         self.layer += 1
-        self.parent.restack_elements()
+        self.parent.request_restack()
         if getattr(self.parent, "selected_element", None) is self and hasattr(self.parent, "layer_var"):
             self.parent.layer_var.set(str(int(self.layer)))
         if hasattr(self.parent, "push_history"):
@@ -90,7 +456,7 @@ class DraggableElement:
     def lower_layer(self):
         if self.layer > 1:
             self.layer -= 1
-            self.parent.restack_elements()
+            self.parent.request_restack()
             if getattr(self.parent, "selected_element", None) is self and hasattr(self.parent, "layer_var"):
                 self.parent.layer_var.set(str(int(self.layer)))
             if hasattr(self.parent, "push_history"):
@@ -102,61 +468,100 @@ class DraggableElement:
         if self in self.parent.selected_elements:
             additive = True
         self.parent.select_element(self, additive=additive)
+        # tag every item of the selection so each drag step is one
+        # ``canvas.move`` call instead of one per item
+        self.canvas.dtag(DRAG_TAG, DRAG_TAG)
+        # snapshot of the selection for the motion handler
+        self._drag_elements = tuple(self.parent.selected_elements)
+        self.parent.prepare_alignment_guides(self, self._drag_elements)
+        for el in self._drag_elements:
+            for item in el.canvas_items:
+                self.canvas.addtag_withtag(DRAG_TAG, item)
         self.last_x = event.x
         self.last_y = event.y
 
     def moving(self, event):
+        self._move_throttle(event)
+
+    def _move_to(self, event):
         dx = event.x - self.last_x
         dy = event.y - self.last_y
-        for el in self.parent.selected_elements:
-            for item in (el.rect, el.label, el.handle, getattr(el, "image_id", None)):
-                if item:
-                    el.canvas.move(item, dx, dy)
+        if not (dx or dy):
+            return  # stationary event, nothing moves and guides stay valid
+        self.canvas.move(DRAG_TAG, dx, dy)
+        for el in self._drag_elements:
             el.x += dx
             el.y += dy
         self.last_x = event.x
         self.last_y = event.y
         snap_dx, snap_dy = self.parent.update_alignment_guides(self)
         if snap_dx or snap_dy:
-            for el in self.parent.selected_elements:
-                for item in (el.rect, el.label, el.handle, getattr(el, "image_id", None)):
-                    if item:
-                        el.canvas.move(item, snap_dx, snap_dy)
+            self.canvas.move(DRAG_TAG, snap_dx, snap_dy)
+            for el in self._drag_elements:
                 el.x += snap_dx
                 el.y += snap_dy
             self.last_x += snap_dx
             self.last_y += snap_dy
-            self.parent.update_alignment_guides(self)
+            self._refresh_guides_later()
 
     def stop_move(self, event):
+        self._move_throttle.flush()
+        self._cancel_guides_refresh()
+        self._drag_elements = ()
         step = self.parent.snap_step
+        inv_step = 1.0 / step
         for el in self.parent.selected_elements:
             # snap top-left corner to the grid with integer multiples to
             # avoid sub-pixel artefacts when adjacent blocks touch
-            el.x = int(round(el.x / step)) * step
-            el.y = int(round(el.y / step)) * step
+            el.x = _snap(el.x, step, inv_step)
+            el.y = _snap(el.y, step, inv_step)
             # also normalise width/height so the entire block aligns to the grid
-            el.width = max(step, int(round(el.width / step)) * step)
-            el.height = max(step, int(round(el.height / step)) * step)
+            el.width = max(step, _snap(el.width, step, inv_step))
+            el.height = max(step, _snap(el.height, step, inv_step))
             el.sync_canvas()
-        self.parent.clear_alignment_guides()
+        self.parent.end_alignment_guides()
         self.parent.push_history()
 
+    def _refresh_guides_later(self, resize=False):
+        # guides only need redrawing once per frame after a snap correction
+        if self._guides_after is None:
+            self._guides_after = self.canvas.after_idle(self._refresh_guides, resize)
+
+    def _refresh_guides(self, resize):
+        self._guides_after = None
+        self.parent.update_alignment_guides(self, resize=resize)
+
+    def _cancel_guides_refresh(self):
+        if self._guides_after is not None:
+            self.canvas.after_cancel(self._guides_after)
+            self._guides_after = None
+
     # ------------------------------------------------------------------
     def start_resize(self, event):
         self.parent.select_element(self)
+        self._interactive = True
         # remember starting mouse position and dimensions so the handle
         # follows the cursor smoothly without jumping to the handle corner
         self.start_w = self.width
         self.start_h = self.height
         self.start_x = event.x
         self.start_y = event.y
+        self._last_resize_key = (event.x, event.y, False)
+        self.parent.prepare_alignment_guides(self)
 
     def resizing(self, event):
+        self._resize_throttle(event)
+
+    def _resize_to(self, event):
+        ctrl = bool(event.state & 0x0004)
+        key = (event.x, event.y, ctrl)
+        if key == self._last_resize_key:
+            return  # stationary event, the size would not change
+        self._last_resize_key = key
         step = self.parent.snap_step
         dx = event.x - self.start_x
         dy = event.y - self.start_y
-        if event.state & 0x0004:  # Ctrl pressed
+        if ctrl:
             delta = dx if abs(dx) > abs(dy) else dy
             self.width = max(step, self.start_w + delta)
             self.height = max(step, self.start_h + delta)
@@ -171,15 +576,20 @@ class DraggableElement:
             self.sync_canvas()
             self.start_w += snap_w
             self.start_h += snap_h
-            self.parent.update_alignment_guides(self, resize=True)
+            self._refresh_guides_later(resize=True)
 
     def stop_resize(self, event):
+        self._resize_throttle.flush()
+        self._cancel_guides_refresh()
+        # the final sync below renders the image in full quality again
+        self._interactive = False
         step = self.parent.snap_step
         # normalise width/height so edges line up exactly on the grid
-        self.width = max(step, int(round(self.width / step)) * step)
-        self.height = max(step, int(round(self.height / step)) * step)
+        inv_step = 1.0 / step
+        self.width = max(step, _snap(self.width, step, inv_step))
+        self.height = max(step, _snap(self.height, step, inv_step))
         self.sync_canvas()
-        self.parent.clear_alignment_guides()
+        self.parent.end_alignment_guides()
         self.parent.push_history()
 
     # ------------------------------------------------------------------
@@ -203,99 +613,96 @@ class DraggableElement:
         }
 
     def sync_canvas(self):
-        self.canvas.coords(
-            self.rect,
-            self.x,
-            self.y,
-            self.x + self.width,
-            self.y + self.height,
-        )
-        if hasattr(self, "image_id") and hasattr(self, "raw_image"):
-            resized = self.raw_image.resize((int(self.width), int(self.height)), Image.LANCZOS)
-            self.image_obj = ImageTk.PhotoImage(resized)
-            self.canvas.itemconfig(self.image_id, image=self.image_obj)
-            self.canvas.coords(self.image_id, self.x, self.y)
-        self._update_label_position()
-        self.canvas.coords(
-            self.handle,
-            self.x + self.width - self.HANDLE_SIZE,
-            self.y + self.height - self.HANDLE_SIZE,
-            self.x + self.width,
-            self.y + self.height,
-        )
-        self.apply_font()
-        if self.auto_font:
+        self._geometry_changed()
+        self._sync_geometry()
+        # ``fit_text`` applies the font itself, avoid configuring it twice
+        if self.auto_font and self.raw_image is None:
             self.fit_text()
+        else:
+            self.apply_font()
         self.update_colors()
 
+    def rescale(self, factor):
+        """Scale position, size and font by ``factor`` for a zoom.
+
+        A zoom leaves colours alone, so unlike ``sync_canvas`` this only
+        touches coordinates, the image size and the font. The caller reports
+        the geometry change once for all elements.
+        """
+        self.x *= factor
+        self.y *= factor
+        self.width *= factor
+        self.height *= factor
+        self.font_size *= factor
+        self._sync_geometry()
+        if self.auto_font and self.raw_image is None:
+            self.fit_text()
+        else:
+            self.apply_font()
+
+    def _sync_geometry(self):
+        canvas = self.canvas
+        x, y = self.x, self.y
+        x2 = x + self.width
+        y2 = y + self.height
+        canvas.coords(self.rect, x, y, x2, y2)
+        if self.raw_image is not None:
+            # NEAREST is cheap enough for every motion event; the high quality
+            # LANCZOS pass is only done once the resize has finished
+            resample = Image.NEAREST if self._interactive else Image.LANCZOS
+            size = (int(self.width), int(self.height))
+            # moves and restyles keep the size, so the current image is reused
+            render = (size, self.raw_image.mode, resample)
+            if self._image_render != render:
+                resized = self.raw_image.resize(size, resample)
+                render = (size, resized.mode, resample)
+                if self._image_render and self._image_render[:2] == render[:2]:
+                    self.image_obj.paste(resized)
+                else:
+                    self.image_obj = ImageTk.PhotoImage(resized)
+                    canvas.itemconfig(self.image_id, image=self.image_obj)
+                self._image_render = render
+            canvas.coords(self.image_id, x, y)
+        self._update_label_position()
+        handle = self.HANDLE_SIZE
+        canvas.coords(self.handle, x2 - handle, y2 - handle, x2, y2)
+
     def update_value(self, value):
         """Update displayed value (text or image)."""
         # Remove previous image if any
-        if hasattr(self, "image_id"):
-            self.canvas.delete(self.image_id)
-            del self.image_id
-            if hasattr(self, "image_obj"):
-                del self.image_obj
-            if hasattr(self, "raw_image"):
-                del self.raw_image
+        if self.raw_image is not None:
+            # the PhotoImage stays around so the next image of the same
+            # size can be pasted into it
+            self.canvas.itemconfig(self.image_id, state="hidden")
+            self.raw_image = None
         try:
             if value is None or pd.isna(value):
                 value = ""
         except TypeError:
             if value is None:
                 value = ""
+        # any download still running for a previous value is now stale
+        self._fetch_token = None
         if isinstance(value, str) and value.lower().startswith("http"):
-            try:
-                resp = requests.get(value, timeout=5)
-                self.raw_image = Image.open(BytesIO(resp.content))
-                img = self.raw_image.resize((int(self.width), int(self.height)), Image.LANCZOS)
-                self.image_obj = ImageTk.PhotoImage(img)
-                self.image_id = self.canvas.create_image(
-                    self.x,
-                    self.y,
-                    anchor="nw",
-                    image=self.image_obj,
+            data = _cached_remote(value)
+            if data is not None:
+                try:
+                    self._show_image(Image.open(BytesIO(data)), value)
+                    return
+                except (OSError, UnidentifiedImageError) as exc:
+                    logger.exception("Failed to load remote image %s", value)
+            else:
+                # show the address until the download finishes
+                token = self._fetch_token = object()
+                future = _get_fetch_pool().submit(_fetch_remote, value)
+                self.canvas.after(
+                    REMOTE_POLL_MS, self._poll_remote, future, value, token
                 )
-                for tag in (self.image_id,):
-                    self.canvas.tag_bind(tag, "<ButtonPress-1>", self.start_move)
-                    self.canvas.tag_bind(tag, "<B1-Motion>", self.moving)
-                    self.canvas.tag_bind(tag, "<ButtonRelease-1>", self.stop_move)
-                    self.canvas.tag_bind(tag, "<Button-3>", self.show_menu)
-                self.canvas.tag_raise(self.rect)
-                self.canvas.tag_raise(self.handle)
-                self.canvas.itemconfig(self.rect, fill="")
-                self.canvas.itemconfig(self.label, text="", state="hidden")
-                self.text = str(value)
-                if hasattr(self.parent, "restack_elements"):
-                    self.parent.restack_elements()
-                return
-            except (requests.RequestException, OSError, UnidentifiedImageError) as exc:
-                logger.exception("Failed to load remote image %s", value)
-        if isinstance(value, str):
+        elif isinstance(value, str):
             local_path = self.parent.find_local_image(value)
             if local_path:
                 try:
-                    self.raw_image = Image.open(local_path)
-                    img = self.raw_image.resize((int(self.width), int(self.height)), Image.LANCZOS)
-                    self.image_obj = ImageTk.PhotoImage(img)
-                    self.image_id = self.canvas.create_image(
-                        self.x,
-                        self.y,
-                        anchor="nw",
-                        image=self.image_obj,
-                    )
-                    for tag in (self.image_id,):
-                        self.canvas.tag_bind(tag, "<ButtonPress-1>", self.start_move)
-                        self.canvas.tag_bind(tag, "<B1-Motion>", self.moving)
-                        self.canvas.tag_bind(tag, "<ButtonRelease-1>", self.stop_move)
-                        self.canvas.tag_bind(tag, "<Button-3>", self.show_menu)
-                    self.canvas.tag_raise(self.rect)
-                    self.canvas.tag_raise(self.handle)
-                    self.canvas.itemconfig(self.rect, fill="")
-                    self.canvas.itemconfig(self.label, text="", state="hidden")
-                    self.text = str(value)
-                    if hasattr(self.parent, "restack_elements"):
-                        self.parent.restack_elements()
+                    self._show_image(_open_local_image(local_path), value)
                     return
                 except (OSError, UnidentifiedImageError) as exc:
                     logger.exception("Failed to load local image %s", local_path)
@@ -308,35 +715,112 @@ class DraggableElement:
             state="normal",
         )
         self.text = str(value)
-        self.apply_font()
         if self.auto_font:
             self.fit_text()
+        else:
+            self.apply_font()
         self._update_label_position()
-        if hasattr(self.parent, "restack_elements"):
-            self.parent.restack_elements()
+        if hasattr(self.parent, "request_restack"):
+            self.parent.request_restack()
+
+    def _poll_remote(self, future, value, token):
+        # the download runs in a worker thread; only this Tk-thread poll
+        # touches the canvas
+        if token is not self._fetch_token or not self.canvas.winfo_exists():
+            return  # superseded by another value or the canvas is gone
+        if not future.done():
+            self.canvas.after(
+                REMOTE_POLL_MS, self._poll_remote, future, value, token
+            )
+            return
+        self._apply_remote_image(future, value)
+
+    def _apply_remote_image(self, future, value):
+        if not self.canvas.type(self.rect):
+            return
+        self._fetch_token = None
+        try:
+            self._show_image(Image.open(BytesIO(future.result())), value)
+        except Exception:  # pragma: no cover - best effort logging
+            logger.exception("Failed to load remote image %s", value)
+
+    def _show_image(self, raw_image, value):
+        """Display ``raw_image`` in place of the text label."""
+        self.raw_image = raw_image
+        size = (int(self.width), int(self.height))
+        img = self.raw_image.resize(size, Image.LANCZOS)
+        render = (size, img.mode, Image.LANCZOS)
+        if (
+            self.image_obj is not None
+            and self._image_render
+            and self._image_render[:2] == render[:2]
+        ):
+            self.image_obj.paste(img)
+        else:
+            self.image_obj = ImageTk.PhotoImage(img)
+        self._image_render = render
+        self.canvas.coords(self.image_id, self.x, self.y)
+        self.canvas.itemconfig(self.image_id, image=self.image_obj, state="normal")
+        self.canvas.itemconfig(self.rect, fill="")
+        self.canvas.itemconfig(self.label, text="", state="hidden")
+        self.text = str(value)
 
     def apply_font(self):
         weight = "bold" if self.bold else "normal"
-        self.canvas.itemconfig(self.label, font=(self.font_family, int(self.font_size), weight))
+        key = (self.font_family, int(self.font_size), weight)
+        if key == self._font_key:
+            return  # e.g. a move or resize that kept the font
+        self._font_key = key
+        self.canvas.itemconfig(self.label, font=_get_label_font(*key))
 
     def fit_text(self):
-        if hasattr(self, "image_id") or not self.auto_font:
+        if self.raw_image is not None or not self.auto_font:
             return
-        size = 1
         weight = "bold" if self.bold else "normal"
-        test_font = tkfont.Font(family=self.font_family, size=size, weight=weight)
-        while True:
-            width = test_font.measure(self.text)
-            height = test_font.metrics("linespace")
-            if width > self.width - 4 or height > self.height - 4:
-                break
-            size += 1
-            test_font.configure(size=size)
-        self.font_size = max(1, size - 1)
+        key = (self.text, self.width, self.height, self.font_family, weight)
+        if self._last_fit and self._last_fit[0] == key:
+            size = self._last_fit[1]
+            if self.font_size != size:
+                self.font_size = size
+                self.apply_font()
+            return
+        max_w = self.width - 4
+        max_h = self.height - 4
+
+        def fits(size):
+            width, height = _measure(self.font_family, size, weight, self.text)
+            return width <= max_w and height <= max_h
+
+        # binary search for the largest size that fits; the line height in
+        # pixels always exceeds the point size, so the box height bounds it
+        lo, hi = 1, max(1, int(self.height))
+        if self._last_fit and self._last_fit[0][2] > 0:
+            # after a zoom or resize the answer is usually the previous size
+            # scaled with the box; probing it and its neighbour first settles
+            # most refits with two measurements instead of a full search
+            guess = int(self._last_fit[1] * self.height / self._last_fit[0][2])
+            guess = min(hi, max(lo, guess))
+            if fits(guess):
+                lo = guess
+                if guess < hi:
+                    if fits(guess + 1):
+                        lo = guess + 1
+                    else:
+                        hi = guess
+            else:
+                hi = guess - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if fits(mid):
+                lo = mid
+            else:
+                hi = mid - 1
+        self._last_fit = (key, lo)
+        self.font_size = lo
         self.apply_font()
 
     def update_colors(self):
-        if hasattr(self, "image_id"):
+        if self.raw_image is not None:
             self.canvas.itemconfig(self.rect, fill="")
         else:
             self.canvas.itemconfig(self.rect, fill=self.bg_color if self.bg_visible else "")
@@ -7,15 +7,21 @@ repository information cannot be derived from ``git`` commands.  We therefore
 fall back to the public GitHub repository defined below.
 """
 
-import io
+import configparser
+import json
 import logging
+import mmap
 import os
 import shutil
+import stat
 import subprocess
-import zipfile
-from typing import Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import requests
+if TYPE_CHECKING:  # imported lazily, only needed when pulling an update
+    import zipfile
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,152 @@ DEFAULT_OWNER = "NefilimPL"
 DEFAULT_REPO = "PDS-Generator_from_excel"
 DEFAULT_BRANCH = "MAIN"
 
+# Size of the blocks in which downloaded archives are written to disk.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Extraction is mostly zlib and file I/O; more threads than this only add
+# contention on the filesystem without speeding the update up.
+EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Shared session so that all GitHub requests reuse pooled keep-alive
+# connections instead of paying a TCP + TLS handshake each time. It is created
+# on first use so that importing this module does not pull in ``requests``.
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=16,
+                    max_retries=Retry(
+                        total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+                    ),
+                ),
+            )
+            _session = session
+    return _session
+
+# Responses of GitHub requests together with their ``ETag`` so that repeated
+# update checks can be revalidated with ``If-None-Match``. GitHub answers
+# such requests with an empty ``304 Not Modified`` which also does not count
+# against the API rate limit.
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".pds_generator", "github_cache.json")
+_cache_lock = threading.Lock()
+# Bodies fetched within the last ``CACHE_TTL`` seconds are reused without
+# contacting GitHub at all, e.g. when several checks run in one session.
+CACHE_TTL = 60
+_recent: Dict[str, Tuple[float, str]] = {}
+
+
+def _load_cache() -> Dict[str, dict]:
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_cache(key: str, entry: dict) -> None:
+    with _cache_lock:
+        cache = _load_cache()
+        cache[key] = entry
+        try:
+            os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+            tmp = f"{CACHE_FILE}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp, CACHE_FILE)
+        except OSError as err:  # pragma: no cover - best effort logging
+            logger.debug("Failed to write GitHub cache: %s", err)
+
+
+def _conditional_get(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+    """Return the body of ``url``, revalidating a cached copy via ``ETag``.
+
+    Raises ``requests`` exceptions just like a plain ``Session.get`` would.
+    """
+    headers = dict(headers or {})
+    # the same URL returns different bodies depending on the media type
+    key = f"{headers.get('Accept', '')} {url}"
+    with _cache_lock:
+        recent = _recent.get(key)
+        if recent and time.monotonic() - recent[0] < CACHE_TTL:
+            return recent[1]
+        entry = _load_cache().get(key)
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    resp = _get_session().get(url, headers=headers, timeout=5)
+    if resp.status_code == 304 and entry:
+        body = entry["body"]
+    else:
+        resp.raise_for_status()
+        body = resp.text
+        etag = resp.headers.get("ETag")
+        if etag:
+            _store_cache(key, {"etag": etag, "body": body})
+    with _cache_lock:
+        _recent[key] = (time.monotonic(), body)
+    return body
+
+
+def _find_git_dir(repo_dir: str) -> Optional[str]:
+    path = os.path.join(repo_dir, ".git")
+    if os.path.isdir(path):
+        return path
+    if os.path.isfile(path):
+        # worktrees and submodules use a ``gitdir: <path>`` file instead
+        with open(path, "r", encoding="utf-8") as f:
+            line = f.read().strip()
+        if line.startswith("gitdir:"):
+            return os.path.normpath(os.path.join(repo_dir, line[len("gitdir:") :].strip()))
+    return None
+
+
+def _read_git_files(git_dir: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return ``(HEAD hash, origin url)`` read directly from ``git_dir``."""
+    common_dir = git_dir
+    commondir_file = os.path.join(git_dir, "commondir")
+    if os.path.isfile(commondir_file):
+        with open(commondir_file, "r", encoding="utf-8") as f:
+            common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+
+    with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf-8") as f:
+        head = f.read().strip()
+    local_hash = None
+    if head.startswith("ref:"):
+        ref = head[len("ref:") :].strip()
+        ref_path = os.path.join(common_dir, *ref.split("/"))
+        if os.path.isfile(ref_path):
+            with open(ref_path, "r", encoding="utf-8") as f:
+                local_hash = f.read().strip() or None
+        else:
+            packed = os.path.join(common_dir, "packed-refs")
+            if os.path.isfile(packed):
+                with open(packed, "r", encoding="utf-8") as f:
+                    for line in f:
+                        parts = line.split()
+                        if len(parts) == 2 and parts[1] == ref:
+                            local_hash = parts[0]
+                            break
+    else:
+        local_hash = head or None  # detached HEAD
+
+    config = configparser.ConfigParser(strict=False, interpolation=None)
+    config.read(os.path.join(common_dir, "config"), encoding="utf-8")
+    remote_url = config.get('remote "origin"', "url", fallback=None)
+    return local_hash, remote_url
+
 
 def get_repo_info(repo_dir: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Return tuple of (local_hash, owner, repo) for given repository directory.
@@ -33,30 +185,51 @@ def get_repo_info(repo_dir: str) -> Tuple[Optional[str], Optional[str], Optional
     If information cannot be determined it will return ``None`` for the missing
     values. The ``owner`` and ``repo`` values correspond to the GitHub
     repository owner and name respectively.
+
+    The values are read straight from the ``.git`` directory; ``git`` itself
+    is only run when that is not possible.
     """
-    local_hash = owner = repo = None
+    local_hash = remote_url = owner = repo = None
+    read_files = False
     try:
-        local_hash = subprocess.check_output(
-            ["git", "rev-parse", "HEAD"], cwd=repo_dir
-        ).decode().strip()
-    except Exception as err:  # pragma: no cover - best effort logging
-        logger.debug("Failed to get local git hash: %s", err)
+        git_dir = _find_git_dir(repo_dir)
+        if git_dir:
+            local_hash, remote_url = _read_git_files(git_dir)
+            read_files = True
+    except (OSError, UnicodeDecodeError, configparser.Error) as err:
+        logger.debug("Failed to read git metadata: %s", err)
 
-    try:
-        remote_url = subprocess.check_output(
-            ["git", "config", "--get", "remote.origin.url"], cwd=repo_dir
-        ).decode().strip()
-        if "github.com" in remote_url:
-            if remote_url.startswith("git@"):
-                owner_repo = remote_url.split("github.com:", 1)[1]
-            else:
-                owner_repo = remote_url.split("github.com/", 1)[1]
-            if owner_repo.endswith(".git"):
-                owner_repo = owner_repo[:-4]
-            if "/" in owner_repo:
-                owner, repo = owner_repo.split("/", 1)
-    except Exception as err:  # pragma: no cover - best effort logging
-        logger.debug("Failed to get remote URL: %s", err)
+    if not read_files:
+        try:
+            local_hash = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except Exception as err:  # pragma: no cover - best effort logging
+            logger.debug("Failed to get local git hash: %s", err)
+        try:
+            remote_url = subprocess.run(
+                ["git", "config", "--get", "remote.origin.url"],
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except Exception as err:  # pragma: no cover - best effort logging
+            logger.debug("Failed to get remote URL: %s", err)
+
+    if remote_url and "github.com" in remote_url:
+        if remote_url.startswith("git@"):
+            owner_repo = remote_url.split("github.com:", 1)[1]
+        else:
+            owner_repo = remote_url.split("github.com/", 1)[1]
+        if owner_repo.endswith(".git"):
+            owner_repo = owner_repo[:-4]
+        if "/" in owner_repo:
+            owner, repo = owner_repo.split("/", 1)
 
     # Fallback to defaults when repository information cannot be determined.
     owner = owner or DEFAULT_OWNER
@@ -67,12 +240,10 @@ def get_repo_info(repo_dir: str) -> Tuple[Optional[str], Optional[str], Optional
 def get_remote_hash(owner: str, repo: str, branch: str = "MAIN") -> Optional[str]:
     """Return the latest commit hash for the given GitHub repo/branch."""
     try:
-        resp = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/commits/{branch}",
-            timeout=5,
+        body = _conditional_get(
+            f"https://api.github.com/repos/{owner}/{repo}/commits/{branch}"
         )
-        resp.raise_for_status()
-        return resp.json().get("sha")
+        return json.loads(body).get("sha")
     except Exception as err:  # pragma: no cover - best effort logging
         logger.debug("Failed to fetch remote hash: %s", err)
     return None
@@ -83,12 +254,17 @@ def get_remote_commit_info(
 ) -> Tuple[Optional[str], Optional[str]]:
     """Return latest commit hash and date for the given GitHub repo/branch."""
     try:
-        resp = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/commits/{branch}",
-            timeout=5,
+        # The commit list leaves out the file list and patches that the
+        # single commit endpoint returns, so one entry is a small response.
+        commits = json.loads(
+            _conditional_get(
+                f"https://api.github.com/repos/{owner}/{repo}/commits"
+                f"?sha={branch}&per_page=1"
+            )
         )
-        resp.raise_for_status()
-        data = resp.json()
+        if not commits:
+            return None, None
+        data = commits[0]
         sha = data.get("sha")
         date = data.get("commit", {}).get("author", {}).get("date")
         if date:
@@ -103,45 +279,169 @@ def get_remote_version(owner: str, repo: str, branch: str = DEFAULT_BRANCH) -> O
     """Return the ``VERSION`` file value from the remote repository."""
     try:
         url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/VERSION"
-        resp = requests.get(url, timeout=5)
-        resp.raise_for_status()
-        return resp.text.strip()
+        return _conditional_get(url).strip()
     except Exception as err:  # pragma: no cover - best effort logging
         logger.debug("Failed to fetch remote VERSION: %s", err)
     return None
 
 
+def get_remote_info(
+    owner: str, repo: str, branch: str = DEFAULT_BRANCH
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return latest commit hash, commit date and ``VERSION`` of the remote.
+
+    Both lookups are independent network round trips, so they are issued
+    concurrently and the call costs roughly one round trip instead of two.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        commit = pool.submit(get_remote_commit_info, owner, repo, branch)
+        version = pool.submit(get_remote_version, owner, repo, branch)
+        sha, date = commit.result()
+        return sha, date, version.result()
+
+
+def _chmod_and_retry(func, path, _exc_info) -> None:
+    # files checked out by git on Windows (e.g. ``.git/objects``) are
+    # read-only, which makes plain ``os.remove`` fail with ``PermissionError``
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _remove_path(path: str) -> None:
+    """Remove ``path`` whatever it is, including read-only entries.
+
+    A single ``lstat`` decides how to remove the entry instead of separate
+    ``exists``/``isdir``/``islink`` probes.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if stat.S_ISDIR(mode):
+        shutil.rmtree(path, onerror=_chmod_and_retry)
+        return
+    try:
+        os.remove(path)
+    except PermissionError:
+        _chmod_and_retry(os.remove, path, None)
+
+
+class _MappedArchive(mmap.mmap):
+    """Read-only memory map usable as a ``ZipFile`` source.
+
+    ``mmap`` only gained ``seekable()`` in Python 3.13, which ``ZipFile.open``
+    requires.
+    """
+
+    def seekable(self) -> bool:
+        return True
+
+
+def _extract_files(archive: str, members: List[Tuple["zipfile.ZipInfo", str]]) -> None:
+    """Extract ``(ZipInfo, target_path)`` pairs from ``archive`` concurrently.
+
+    The parent directories of all targets must already exist.
+
+    ``ZipFile`` objects must not be shared between threads, so every worker
+    lazily opens its own handle on a read-only memory map of the archive.
+    Reads then come straight from the page cache instead of going through
+    buffered file I/O. Decompression and file writes release the GIL, which
+    lets the members be written in parallel.
+    """
+    import zipfile
+
+    local = threading.local()
+    handles = []
+
+    def extract(member: Tuple["zipfile.ZipInfo", str]) -> None:
+        info, target = member
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            mm = _MappedArchive(src_file.fileno(), 0, access=mmap.ACCESS_READ)
+            zf = local.zf = zipfile.ZipFile(mm)
+            handles.append((zf, mm))
+        # ``ZipExtFile`` verifies the member's CRC-32 (via zlib) once it has
+        # been read to the end, so write to a sibling file first and only
+        # replace the existing file with a member that passed the check
+        partial = f"{target}.part"
+        try:
+            with zf.open(info) as src, open(partial, "wb") as dst:
+                shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+        except BaseException:
+            _remove_path(partial)
+            raise
+        try:
+            os.replace(partial, target)
+        except OSError:
+            # the target is a directory or a read-only file
+            _remove_path(target)
+            os.replace(partial, target)
+
+    # start with the biggest members so one large file picked up last does
+    # not leave the other workers idle at the end of the run
+    members = sorted(members, key=lambda m: m[0].compress_size, reverse=True)
+    with open(archive, "rb") as src_file:
+        try:
+            with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+                # consume the results so errors raised in workers propagate
+                for _ in pool.map(extract, members):
+                    pass
+        finally:
+            # the mappings must be released before the archive can be removed
+            for zf, mm in handles:
+                zf.close()
+                mm.close()
+
+
 def _download_and_extract(repo_dir: str, owner: str, repo: str, branch: str) -> bool:
     """Download repo archive from GitHub and extract into ``repo_dir``."""
+    # only needed for updates, so keep them out of the GUI start-up
+    import tempfile
+    import urllib.request
+    import zipfile
+
     url = f"https://codeload.github.com/{owner}/{repo}/zip/refs/heads/{branch}"
+    # Stream the archive to a temporary file instead of buffering the whole
+    # response in memory; ``ZipFile`` can then seek in a real file.
+    tmp_path = None
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
-            top = f"{repo}-{branch}"
-            for member in zf.namelist():
-                if not member.startswith(top + "/"):
+        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
+            tmp_path = tmp.name
+            # plain urllib is enough for a single streamed download
+            with urllib.request.urlopen(url, timeout=60) as resp:
+                shutil.copyfileobj(resp, tmp, DOWNLOAD_CHUNK_SIZE)
+        files = []
+        dirs = set()
+        with zipfile.ZipFile(tmp_path) as zf:
+            top = f"{repo}-{branch}/"
+            for info in zf.infolist():
+                if not info.filename.startswith(top):
                     continue
-                rel_path = member[len(top) + 1 :]
+                rel_path = info.filename[len(top) :]
                 if not rel_path:
                     continue
                 target = os.path.join(repo_dir, rel_path)
-                if member.endswith("/"):
+                if info.is_dir():
                     if os.path.isfile(target) or os.path.islink(target):
-                        os.remove(target)
-                    os.makedirs(target, exist_ok=True)
+                        _remove_path(target)
+                    dirs.add(os.path.normpath(target))
                 else:
-                    if os.path.exists(target):
-                        if os.path.isdir(target) and not os.path.islink(target):
-                            shutil.rmtree(target)
-                        else:
-                            os.remove(target)
-                    os.makedirs(os.path.dirname(target), exist_ok=True)
-                    with zf.open(member) as src, open(target, "wb") as dst:
-                        shutil.copyfileobj(src, dst)
+                    dirs.add(os.path.dirname(target))
+                    files.append((info, target))
+        # create every directory once up front so the extraction workers do
+        # not repeat ``makedirs`` (and its stat calls) for each member
+        for directory in sorted(dirs):
+            os.makedirs(directory, exist_ok=True)
+        _extract_files(tmp_path, files)
         return True
     except Exception as err:  # pragma: no cover - best effort logging
         logger.error("Failed to download archive: %s", err)
+    finally:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError as err:  # pragma: no cover - best effort logging
+                logger.debug("Failed to remove temporary archive: %s", err)
     return False
 
 
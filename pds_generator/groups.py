@@ -1,12 +1,103 @@
 import logging
+from bisect import bisect_right, insort
+from contextlib import contextmanager
 
+import numpy as np
+from PIL import Image, ImageTk
 import tkinter as tk
 from tkinter import ttk, colorchooser
 
-from .elements import DraggableElement
+from .elements import (
+    DRAG_TAG,
+    DraggableElement,
+    GuideIndex,
+    MotionThrottle,
+    forget_stacking,
+    stack_by_layer,
+)
 
 logger = logging.getLogger(__name__)
 
+# Groups with more fields than this round their geometry with NumPy when
+# serialised (e.g. for every undo snapshot); below it the array setup costs
+# more than it saves.
+VECTORIZE_MIN_FIELDS = 32
+
+# Rendered grid images kept per editor, so zooming back and forth between a
+# few scales reuses them instead of painting the grid again.
+GRID_CACHE_SIZE = 4
+
+
+def _round_rows(rows):
+    """Round every value of ``rows`` to ``int``; returns a list of tuples.
+
+    ``np.rint`` rounds halves to even exactly like the built-in ``round``.
+    """
+    if len(rows) > VECTORIZE_MIN_FIELDS:
+        rounded = np.rint(np.array(rows, dtype=float)).astype(int).tolist()
+        return [tuple(row) for row in rounded]
+    return [tuple(int(round(value)) for value in row) for row in rows]
+
+
+def grid_image(width, height, step, shade):
+    """Render grid lines every ``step`` pixels on white as an RGB image.
+
+    The image covers ``0..width`` x ``0..height`` inclusive and the lines are
+    grey level ``shade``. Whole columns and rows are painted at once instead
+    of drawing line by line.
+    """
+    pixels = np.full((height + 1, width + 1, 3), 255, dtype=np.uint8)
+    if step == int(step):
+        # whole-pixel steps (e.g. at 100% zoom) are plain strides
+        pixels[:, :: int(step)] = shade
+        pixels[:: int(step), :] = shade
+    else:
+        # ``np.rint`` rounds halves to even like the built-in ``round``
+        xs = np.rint(np.arange(int(width / step) + 1) * step).astype(np.intp)
+        ys = np.rint(np.arange(int(height / step) + 1) * step).astype(np.intp)
+        pixels[:, xs] = shade
+        pixels[ys, :] = shade
+    return Image.fromarray(pixels, "RGB")
+
+
+_INF = float("inf")
+
+
+def stack_columns(columns, max_height):
+    """Lay out group fields column by column.
+
+    ``columns`` maps a column's x position to ``(y, width, height, payload)``
+    tuples. Within a column the fields are stacked top to bottom in order of
+    their ``y``; a field is pushed further down while it collides with a field
+    of a column to its left that is wide enough to reach into this one.
+    Fields that would end below ``max_height`` are left out.
+
+    Yields ``(x, y, width, height, payload)`` for every placed field.
+    """
+    # (right edge, top, bottom) of the fields placed so far, kept sorted
+    placed = []
+    for x in sorted(columns):
+        # fields of the same column never overlap the next one, so only the
+        # columns to the left that reach past ``x`` have to be checked; with
+        # ``placed`` sorted by right edge those are a suffix of the list
+        first = bisect_right(placed, (x, _INF, _INF))
+        spans = sorted((top, bottom) for _, top, bottom in placed[first:])
+        cur_y = 0
+        for _, w, h, payload in sorted(columns[x], key=lambda t: t[0]):
+            y = cur_y
+            for top, bottom in spans:
+                if top >= y + h:
+                    # the spans are sorted by their top edge
+                    break
+                if bottom > y:
+                    y = bottom
+            if y + h > max_height:
+                continue
+            yield x, y, w, h, payload
+            insort(placed, (x + w, y, y + h))
+            cur_y = y + h
+
+
 class GroupArea:
     """Semi-transparent rectangle grouping elements."""
 
@@ -26,7 +117,17 @@ class GroupArea:
         self.field_pos = {}  # mapping name -> (x,y) inside the group
         self.field_conf = {}  # individual field styling inside the group
         self.conditions = []
-        self.preview_items = []
+        # field name -> (rect, text) items of the preview, reused on redraw
+        self.preview_slots = {}
+        # (geometry version, elements inside) cached between drags
+        self._contained = None
+        # preview redraws are deferred while inside ``batch_updates``
+        self._batch_depth = 0
+        self._preview_pending = False
+        self._move_throttle = MotionThrottle(canvas, self._move_to)
+        self._resize_throttle = MotionThrottle(canvas, self._resize_to)
+        # the outline and all preview items share one set of bindings
+        self.body_tag = f"group{id(self)}"
         self.rect = canvas.create_rectangle(
             self.x,
             self.y,
@@ -37,6 +138,7 @@ class GroupArea:
             # Tkinter doesn't support 8-digit hex colors; use stipple for translucency
             fill="#88aaff",
             stipple="gray50",
+            tags=(self.body_tag,),
         )
         self.handle = canvas.create_rectangle(
             self.x + self.width - self.HANDLE_SIZE,
@@ -45,15 +147,15 @@ class GroupArea:
             self.y + self.height,
             fill="black",
         )
-        for tag in (self.rect,):
-            canvas.tag_bind(tag, "<ButtonPress-1>", self.start_move)
-            canvas.tag_bind(tag, "<B1-Motion>", self.moving)
-            canvas.tag_bind(tag, "<ButtonRelease-1>", self.stop_move)
-            canvas.tag_bind(tag, "<Double-1>", self.open_editor)
+        canvas.tag_bind(self.body_tag, "<ButtonPress-1>", self.start_move)
+        canvas.tag_bind(self.body_tag, "<B1-Motion>", self.moving)
+        canvas.tag_bind(self.body_tag, "<ButtonRelease-1>", self.stop_move)
+        canvas.tag_bind(self.body_tag, "<Double-1>", self.open_editor)
         canvas.tag_bind(self.handle, "<ButtonPress-1>", self.start_resize)
         canvas.tag_bind(self.handle, "<B1-Motion>", self.resizing)
         canvas.tag_bind(self.handle, "<ButtonRelease-1>", self.stop_resize)
         canvas.tag_bind(self.handle, "<Double-1>", self.open_editor)
+        forget_stacking(canvas)
         self.send_to_back()
         self.draw_preview()
 
@@ -69,22 +171,26 @@ class GroupArea:
         self.last_x = event.x
         self.last_y = event.y
         # capture elements currently inside so they move with the group
-        self.children = [
-            el
-            for el in self.parent.elements.values()
-            if self.parent.element_in_group(el, self)
-        ]
+        self.children = self.contained_elements()
+        self.parent.prepare_alignment_guides(self, self.children)
+        # tag the group and its children so each drag step is a single
+        # ``canvas.move`` call
+        self.canvas.dtag(DRAG_TAG, DRAG_TAG)
+        for item in (self.rect, self.handle):
+            self.canvas.addtag_withtag(DRAG_TAG, item)
+        for el in self.children:
+            for item in el.canvas_items:
+                self.canvas.addtag_withtag(DRAG_TAG, item)
 
     def moving(self, event):
+        self._move_throttle(event)
+
+    def _move_to(self, event):
         dx = event.x - self.last_x
         dy = event.y - self.last_y
-        for item in (self.rect, self.handle):
-            self.canvas.move(item, dx, dy)
-        # move contained elements together with the group
+        # contained elements move together with the group
+        self.canvas.move(DRAG_TAG, dx, dy)
         for el in self.children:
-            for item in (el.rect, el.label, el.handle, getattr(el, "image_id", None)):
-                if item:
-                    self.canvas.move(item, dx, dy)
             el.x += dx
             el.y += dy
         self.x += dx
@@ -93,12 +199,8 @@ class GroupArea:
         self.last_y = event.y
         snap_dx, snap_dy = self.parent.update_alignment_guides(self)
         if snap_dx or snap_dy:
-            for item in (self.rect, self.handle):
-                self.canvas.move(item, snap_dx, snap_dy)
+            self.canvas.move(DRAG_TAG, snap_dx, snap_dy)
             for el in self.children:
-                for item in (el.rect, el.label, el.handle, getattr(el, "image_id", None)):
-                    if item:
-                        self.canvas.move(item, snap_dx, snap_dy)
                 el.x += snap_dx
                 el.y += snap_dy
             self.x += snap_dx
@@ -108,6 +210,7 @@ class GroupArea:
             self.parent.update_alignment_guides(self)
 
     def stop_move(self, event):
+        self._move_throttle.flush()
         step = self.parent.snap_step
         new_x = int(round(self.x / step)) * step
         new_y = int(round(self.y / step)) * step
@@ -118,47 +221,91 @@ class GroupArea:
         # ensure the group's dimensions also align with the grid
         self.width = max(step, int(round(self.width / step)) * step)
         self.height = max(step, int(round(self.height / step)) * step)
-        self.sync_canvas()
-        # snap children by the same offset
+        # snap children by the same offset; ``sync_canvas`` below places the
+        # group's own items absolutely
         if dx or dy:
+            self.canvas.move(DRAG_TAG, dx, dy)
             for el in self.children:
-                for item in (el.rect, el.label, el.handle, getattr(el, "image_id", None)):
-                    if item:
-                        self.canvas.move(item, dx, dy)
                 el.x += dx
                 el.y += dy
-        self.parent.clear_alignment_guides()
+        self.canvas.dtag(DRAG_TAG, DRAG_TAG)
+        self.sync_canvas()
+        self.parent.end_alignment_guides()
 
     def start_resize(self, event):
         self.start_x = event.x
         self.start_y = event.y
         self.start_w = self.width
         self.start_h = self.height
+        self.parent.prepare_alignment_guides(self)
 
     def resizing(self, event):
+        self._resize_throttle(event)
+
+    def _resize_to(self, event):
         step = self.parent.snap_step
         dx = event.x - self.start_x
         dy = event.y - self.start_y
         self.width = max(step, self.start_w + dx)
         self.height = max(step, self.start_h + dy)
-        self.sync_canvas()
+        # the field preview is only rebuilt once the resize has finished
+        self.sync_frame()
         snap_w, snap_h = self.parent.update_alignment_guides(self, resize=True)
         if snap_w or snap_h:
             self.width += snap_w
             self.height += snap_h
-            self.sync_canvas()
+            self.sync_frame()
             self.start_w += snap_w
             self.start_h += snap_h
             self.parent.update_alignment_guides(self, resize=True)
 
     def stop_resize(self, event):
+        self._resize_throttle.flush()
         step = self.parent.snap_step
         self.width = max(step, int(round(self.width / step)) * step)
         self.height = max(step, int(round(self.height / step)) * step)
         self.sync_canvas()
-        self.parent.clear_alignment_guides()
+        self.parent.end_alignment_guides()
 
-    def sync_canvas(self):
+    def contained_elements(self):
+        """Return the elements inside the group.
+
+        The list is only rebuilt after some element or group changed its
+        geometry since the last call.
+        """
+        version = self.parent.geometry_version
+        if self._contained is None or self._contained[0] != version:
+            elements = [
+                el
+                for el in self.parent.elements.values()
+                if self.parent.element_in_group(el, self)
+            ]
+            self._contained = (version, elements)
+        return self._contained[1]
+
+    @contextmanager
+    def batch_updates(self):
+        """Redraw the field preview once, after a series of changes.
+
+        ``draw_preview`` calls made inside the block are collapsed into a
+        single redraw when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._preview_pending:
+                self._preview_pending = False
+                self.draw_preview()
+
+    def sync_frame(self):
+        """Move the outline and handle without rebuilding the preview.
+
+        Moving items does not change their stacking order, so this does not
+        restack either.
+        """
+        self.parent.geometry_changed()
         self.canvas.coords(
             self.rect,
             self.x,
@@ -173,7 +320,10 @@ class GroupArea:
             self.x + self.width,
             self.y + self.height,
         )
-        self.send_to_back()
+
+    def sync_canvas(self):
+        self.sync_frame()
+        # also restores the stacking order of the group's items
         self.draw_preview()
 
     def open_editor(self, event=None):
@@ -185,21 +335,25 @@ class GroupArea:
 
     def to_dict(self):
         scale = self.parent.scale
+        names = list(self.field_conf)
+        confs = list(self.field_conf.values())
+        sizes = _round_rows(
+            [(conf["width"], conf["height"], conf["font_size"]) for conf in confs]
+        )
         return {
             "name": self.name,
             "x": int(round(self.x / scale)),
             "y": int(round(self.y / scale)),
             "width": int(round(self.width / scale)),
             "height": int(round(self.height / scale)),
-            "field_pos": {
-                k: (int(round(v[0])), int(round(v[1])))
-                for k, v in self.field_pos.items()
-            },
+            "field_pos": dict(
+                zip(self.field_pos, _round_rows([v[:2] for v in self.field_pos.values()]))
+            ),
             "field_conf": {
                 k: {
-                    "width": int(round(conf["width"])),
-                    "height": int(round(conf["height"])),
-                    "font_size": int(round(conf["font_size"])),
+                    "width": width,
+                    "height": height,
+                    "font_size": font_size,
                     "bold": conf.get("bold", False),
                     "text_color": conf.get("text_color", "black"),
                     "bg_color": conf.get("bg_color", "white"),
@@ -208,77 +362,76 @@ class GroupArea:
                     "auto_font": conf.get("auto_font", True),
                     "layer": conf.get("layer", 1),
                 }
-                for k, conf in self.field_conf.items()
+                for k, conf, (width, height, font_size) in zip(names, confs, sizes)
             },
             "conditions": list(self.conditions),
         }
 
     def draw_preview(self):
-        for item in getattr(self, "preview_items", []):
-            self.canvas.delete(item)
-        self.preview_items = []
+        if self._batch_depth:
+            self._preview_pending = True
+            return
+        slots = self.preview_slots
         if not self.fields:
+            self._drop_preview_slots(list(slots))
+            self.send_to_back()
             return
         # Build columns keyed by their x position (unscaled values)
         cols = {}
         scale = self.parent.scale
+        field_pos = self.field_pos
+        field_conf = self.field_conf
         for name in self.fields:
-            x, _y = self.field_pos.get(name, (0, 0))
-            conf = self.field_conf.get(name, {})
-            w = conf.get("width", 50)
-            h = conf.get("height", 25)
-            cols.setdefault(x, []).append((self.field_pos.get(name, (0, 0))[1], w, h, name))
-
-        placed = []  # keep already positioned rectangles to detect collisions
-        for x in sorted(cols):
-            items = cols[x]
-            items.sort(key=lambda t: t[0])
-            cur_y = 0
-            for _, w, h, name in items:
-                y = cur_y
-                # push down while colliding with any previously placed item
-                while True:
-                    overlap = False
-                    for px, py, pw, ph in placed:
-                        # Only treat as a collision when the candidate
-                        # rectangle overlaps horizontally and vertically with
-                        # a previously placed one. Ignoring blocks entirely
-                        # below prevents reordering when a tall block exists
-                        # underneath a smaller one.
-                        if (
-                            x < px + pw
-                            and x + w > px
-                            and y < py + ph
-                            and y + h > py
-                        ):
-                            y = py + ph
-                            overlap = True
-                            break
-                    if not overlap:
-                        break
-                if y + h > self.height:
-                    continue
-                # scale positions and sizes for canvas display
-                sx = x * scale
-                sy = y * scale
-                sw = w * scale
-                sh = h * scale
-                x1 = self.x + sx
-                y1 = self.y + sy
-                r = self.canvas.create_rectangle(
-                    x1, y1, x1 + sw, y1 + sh, outline="blue", fill="white"
-                )
-                t = self.canvas.create_text(x1 + 2, y1 + sh / 2, anchor="w", text=name)
-                for item in (r, t):
-                    self.canvas.tag_bind(item, "<ButtonPress-1>", self.start_move)
-                    self.canvas.tag_bind(item, "<B1-Motion>", self.moving)
-                    self.canvas.tag_bind(item, "<ButtonRelease-1>", self.stop_move)
-                    self.canvas.tag_bind(item, "<Double-1>", self.open_editor)
-                self.preview_items.extend([r, t])
-                placed.append((x, y, w, h))
-                cur_y = y + h
+            x, y = field_pos.get(name, (0, 0))
+            conf = field_conf.get(name, {})
+            cols.setdefault(x, []).append(
+                (y, conf.get("width", 50), conf.get("height", 25), name)
+            )
+
+        canvas = self.canvas
+        coords = canvas.coords
+        tags = (self.body_tag,)
+        gx, gy = self.x, self.y
+        shown = set()
+        for x, y, w, h, name in stack_columns(cols, self.height):
+            # scale positions and sizes for canvas display
+            x1 = gx + x * scale
+            y1 = gy + y * scale
+            x2 = x1 + w * scale
+            y2 = y1 + h * scale
+            ty = (y1 + y2) / 2
+            shown.add(name)
+            slot = slots.get(name)
+            if slot:
+                # moving existing items is much cheaper than recreating them
+                r, t = slot
+                coords(r, x1, y1, x2, y2)
+                coords(t, x1 + 2, ty)
+                continue
+            r = canvas.create_rectangle(
+                x1, y1, x2, y2, outline="blue", fill="white", tags=tags
+            )
+            t = canvas.create_text(x1 + 2, ty, anchor="w", text=name, tags=tags)
+            slots[name] = (r, t)
+            forget_stacking(canvas)
+        self._drop_preview_slots([name for name in slots if name not in shown])
         self.send_to_back()
 
+    def _drop_preview_slots(self, names):
+        for name in names:
+            for item in self.preview_slots.pop(name):
+                self.canvas.delete(item)
+            forget_stacking(self.canvas)
+
+    def destroy(self):
+        """Remove the group's canvas items."""
+        self._drop_preview_slots(list(self.preview_slots))
+        self.canvas.delete(self.rect)
+        self.canvas.delete(self.handle)
+        forget_stacking(self.canvas)
+        for sequence in ("<ButtonPress-1>", "<B1-Motion>", "<ButtonRelease-1>", "<Double-1>"):
+            self.canvas.tag_unbind(self.body_tag, sequence)
+
 
 
 class GroupEditor(tk.Toplevel):
@@ -299,6 +452,19 @@ class GroupEditor(tk.Toplevel):
         self.conditions = list(group.conditions)
         self.align_line_h = None
         self.align_line_v = None
+        self._guide_index = None
+        self._grid_cache = {}
+        self._grid_key = None
+        self._grid_item = None
+        self._restack_after = None
+        self._batch_depth = 0
+        self._restack_pending = False
+        # zoom requested by the wheel/buttons, unrounded; applied once the
+        # burst is over and kept even when too small a change to redraw, so
+        # later steps build on it
+        self._target_scale = self.scale
+        self._scale_after = None
+        self._select_throttle = MotionThrottle(self, self._drag_select_to)
 
         toolbar = ttk.Frame(self)
         toolbar.pack(fill="x", padx=5, pady=5)
@@ -351,6 +517,10 @@ class GroupEditor(tk.Toplevel):
         self.canvas.bind("<ButtonRelease-1>", self.canvas_button_release)
         self.canvas.bind("<Control-MouseWheel>", self.ctrl_zoom)
         self.canvas_container = left
+        # last size reported by Tk, read by ``fit_to_window`` without a
+        # ``winfo`` round trip; zero until the frame is first laid out
+        self._container_size = (0, 0)
+        left.bind("<Configure>", self._on_container_resize)
         self.draw_grid()
 
         right = ttk.Frame(main)
@@ -372,9 +542,8 @@ class GroupEditor(tk.Toplevel):
 
         self.vars = {}
         available = list(parent.columns_vars.keys()) + list(parent.static_vars.keys())
-        for name in available:
+        for name, label in zip(available, parent.display_names(available)):
             var = tk.BooleanVar(value=name in group.field_pos)
-            label = parent.display_name(name)
             cb = ttk.Checkbutton(
                 self.avail_frame,
                 text=label,
@@ -384,22 +553,42 @@ class GroupEditor(tk.Toplevel):
             cb.pack(anchor="w")
             self.vars[name] = var
 
-        for name, pos in group.field_pos.items():
-            self.add_element(name, pos)
+        with self.batch_updates():
+            for name, pos in group.field_pos.items():
+                self.add_element(name, pos)
 
         self.protocol("WM_DELETE_WINDOW", self.close)
 
     def draw_grid(self):
-        self.canvas.delete("grid")
+        """Show the snapping grid as one image item below everything else.
+
+        A single image keeps the canvas free of the hundreds of line items a
+        large group would need. Images are cached per step and canvas size
+        (least recently used dropped first), so only a new zoom level paints
+        the grid again.
+        """
         step = self.snap_step
-        cols = int(self.width / step) + 1
-        rows = int(self.height / step) + 1
-        for i in range(cols):
-            x = i * step
-            self.canvas.create_line(x, 0, x, self.height, fill="#ddd", tags="grid")
-        for i in range(rows):
-            y = i * step
-            self.canvas.create_line(0, y, self.width, y, fill="#ddd", tags="grid")
+        # the same zoom reached through different factor products differs in
+        # the last float bits only; rounding keeps it on the cached image
+        key = (round(step, 6), self.width, self.height)
+        if key == self._grid_key:
+            return
+        cache = self._grid_cache
+        image = cache.pop(key, None)
+        if image is None:
+            image = ImageTk.PhotoImage(grid_image(self.width, self.height, step, 0xDD))
+            while len(cache) >= GRID_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        # re-inserting marks the entry as most recently used
+        cache[key] = image
+        self._grid_key = key
+        if self._grid_item is None:
+            self._grid_item = self.canvas.create_image(
+                0, 0, anchor="nw", image=image, state="disabled", tags="grid"
+            )
+            self.canvas.tag_lower(self._grid_item)
+        else:
+            self.canvas.itemconfig(self._grid_item, image=image)
 
     def clear_alignment_guides(self):
         for line in (self.align_line_h, self.align_line_v):
@@ -407,42 +596,45 @@ class GroupEditor(tk.Toplevel):
                 self.canvas.delete(line)
         self.align_line_h = self.align_line_v = None
 
+    def _guide_candidates(self, element):
+        return [el for el in self.elements.values() if el is not element]
+
+    def prepare_alignment_guides(self, element, moving=()):
+        """Index the edges ``element`` can snap to for the coming drag.
+
+        Items in ``moving`` travel together with ``element``; their distance
+        to it never changes, so they are not snap targets.
+        """
+        moving = set(moving)
+        others = [el for el in self._guide_candidates(element) if el not in moving]
+        self._guide_index = (element, GuideIndex(others))
+
+    def end_alignment_guides(self):
+        self._guide_index = None
+        self.clear_alignment_guides()
+
     def update_alignment_guides(self, element, resize=False):
         self.clear_alignment_guides()
-        others = [el for el in self.elements.values() if el is not element]
+        if self._guide_index and self._guide_index[0] is element:
+            index = self._guide_index[1]
+        else:
+            index = GuideIndex(self._guide_candidates(element))
         x1, y1 = element.x, element.y
         x2, y2 = element.x + element.width, element.y + element.height
         tol = 5
         snap_dx = snap_dy = 0
-        for other in others:
-            ox1, oy1 = other.x, other.y
-            ox2, oy2 = other.x + other.width, other.y + other.height
-            if not self.align_line_v:
-                edges = [x2] if resize else [x1, x2]
-                for x in edges:
-                    for ox in (ox1, ox2):
-                        if abs(x - ox) <= tol:
-                            snap_dx = ox - x
-                            self.align_line_v = self.canvas.create_line(
-                                ox, min(y1, oy1), ox, max(y2, oy2), fill="red"
-                            )
-                            break
-                    if self.align_line_v:
-                        break
-            if not self.align_line_h:
-                edges = [y2] if resize else [y1, y2]
-                for y in edges:
-                    for oy in (oy1, oy2):
-                        if abs(y - oy) <= tol:
-                            snap_dy = oy - y
-                            self.align_line_h = self.canvas.create_line(
-                                min(x1, ox1), oy, max(x2, ox2), oy, fill="red"
-                            )
-                            break
-                    if self.align_line_h:
-                        break
-            if self.align_line_h and self.align_line_v:
-                break
+        match = index.match_x([x2] if resize else [x1, x2], tol)
+        if match:
+            snap_dx, ox, other = match
+            self.align_line_v = self.canvas.create_line(
+                ox, min(y1, other.y), ox, max(y2, other.y + other.height), fill="red"
+            )
+        match = index.match_y([y2] if resize else [y1, y2], tol)
+        if match:
+            snap_dy, oy, other = match
+            self.align_line_h = self.canvas.create_line(
+                min(x1, other.x), oy, max(x2, other.x + other.width), oy, fill="red"
+            )
         return snap_dx, snap_dy
 
     def add_element(self, name, pos=None):
@@ -487,9 +679,11 @@ class GroupEditor(tk.Toplevel):
         else:
             el = self.elements.pop(name, None)
             if el:
-                for item in (el.rect, el.label, el.handle, getattr(el, "image_id", None)):
-                    if item:
-                        self.canvas.delete(item)
+                el.destroy()
+                if el in self.selected_elements:
+                    self.selected_elements.remove(el)
+                if self.selected_element is el:
+                    self.selected_element = None
             if name in self.group.fields:
                 self.group.fields.remove(name)
 
@@ -519,29 +713,58 @@ class GroupEditor(tk.Toplevel):
             self.layer_entry.configure(state="disabled")
             self.layer_var.set("")
 
+    def select_elements(self, elements):
+        """Add ``elements`` to the selection.
+
+        Same as ``select_element(el, additive=True)`` for each of them, but
+        the highlight and the toolbar are only refreshed once.
+        """
+        for el in elements:
+            if el not in self.selected_elements:
+                self.selected_elements.append(el)
+        if self.selected_elements:
+            self.select_element(self.selected_elements[-1], additive=True)
+
+    def _pointer_on_item(self):
+        """Whether the pointer is over an item other than the grid image.
+
+        The grid image spans the whole canvas, so Tk reports it as the
+        current item even over empty space.
+        """
+        current = self.canvas.find_withtag("current")
+        return bool(current) and current[0] != self._grid_item
+
     def canvas_button_press(self, event):
-        if self.canvas.find_withtag("current"):
+        if self._pointer_on_item():
             return
         self.select_element(None)
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
         self.sel_start = (x, y)
+        self._sel_pointer = (event.x, event.y)
         self.sel_rect = self.canvas.create_rectangle(
             x, y, x, y, outline="blue", dash=(2, 2), width=2
         )
         self.canvas.tag_raise(self.sel_rect)
 
     def canvas_drag_select(self, event):
+        self._select_throttle(event)
+
+    def _drag_select_to(self, event):
         if not getattr(self, "sel_start", None):
             return
+        if (event.x, event.y) == self._sel_pointer:
+            return  # stationary event, the rectangle would not change
+        self._sel_pointer = (event.x, event.y)
         x0, y0 = self.sel_start
         x1 = self.canvas.canvasx(event.x)
         y1 = self.canvas.canvasy(event.y)
         self.canvas.coords(self.sel_rect, x0, y0, x1, y1)
 
     def canvas_button_release(self, event):
+        self._select_throttle.flush()
         if not getattr(self, "sel_start", None):
-            if not self.canvas.find_withtag("current"):
+            if not self._pointer_on_item():
                 self.select_element(None)
             return
         x0, y0 = self.sel_start
@@ -555,10 +778,17 @@ class GroupEditor(tk.Toplevel):
         if y0 > y1:
             y0, y1 = y1, y0
         self.select_element(None)
-        for el in self.elements.values():
-            ex0, ey0, ex1, ey1 = self.canvas.coords(el.rect)
-            if ex0 >= x0 and ex1 <= x1 and ey0 >= y0 and ey1 <= y1:
-                self.select_element(el, additive=True)
+        # the element geometry mirrors its rectangle, no need to ask Tk
+        self.select_elements(
+            [
+                el
+                for el in self.elements.values()
+                if el.x >= x0
+                and el.x + el.width <= x1
+                and el.y >= y0
+                and el.y + el.height <= y1
+            ]
+        )
 
     def toggle_bold(self):
         el = self.selected_element
@@ -610,7 +840,7 @@ class GroupEditor(tk.Toplevel):
         if layer < 1:
             layer = 1
         el.layer = layer
-        self.restack_elements()
+        self.request_restack()
         self.layer_var.set(str(int(el.layer)))
 
     def choose_text_color(self):
@@ -642,7 +872,34 @@ class GroupEditor(tk.Toplevel):
         el.bg_visible = not self.transparent_var.get()
         el.update_colors()
         
+    @contextmanager
+    def batch_updates(self):
+        """Restack the elements once, after a series of changes.
+
+        ``restack_elements`` calls made inside the block are collapsed into a
+        single restack when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._restack_pending:
+                self._restack_pending = False
+                self.restack_elements()
+
+    def request_restack(self):
+        """Restack once after the current burst of element updates."""
+        if self._restack_after is None:
+            self._restack_after = self.after_idle(self.restack_elements)
+
     def restack_elements(self):
+        if self._restack_after is not None:
+            self.after_cancel(self._restack_after)
+            self._restack_after = None
+        if self._batch_depth:
+            self._restack_pending = True
+            return
         if not self.elements:
             return
         min_layer = min(el.layer for el in self.elements.values())
@@ -650,14 +907,7 @@ class GroupEditor(tk.Toplevel):
             shift = 1 - min_layer
             for el in self.elements.values():
                 el.layer += shift
-        for el in sorted(self.elements.values(), key=lambda e: e.layer):
-            for item in filter(None, [
-                el.rect,
-                el.label,
-                getattr(el, "image_id", None),
-                el.handle,
-            ]):
-                self.canvas.tag_raise(item)
+        stack_by_layer(self.canvas, self.elements.values())
         if self.selected_element:
             self.layer_var.set(str(int(self.selected_element.layer)))
 
@@ -703,68 +953,105 @@ class GroupEditor(tk.Toplevel):
             self.parent.push_history()
 
     def close(self):
-        self.group.field_pos = {
-            name: (int(round(el.x / self.scale)), int(round(el.y / self.scale)))
-            for name, el in self.elements.items()
-        }
-        self.group.fields = list(self.group.field_pos.keys())
-        self.group.conditions = list(self.conditions)
-        self.group.field_conf = {
-            name: {
-                "width": el.width / self.scale,
-                "height": el.height / self.scale,
-                "font_size": el.font_size / self.scale,
-                "bold": el.bold,
-                "text_color": el.text_color,
-                "bg_color": el.bg_color,
-                "bg_visible": el.bg_visible,
-                "align": el.align,
-                "auto_font": el.auto_font,
-                "layer": el.layer,
+        with self.parent.batch_history():
+            self.group.field_pos = {
+                name: (int(round(el.x / self.scale)), int(round(el.y / self.scale)))
+                for name, el in self.elements.items()
             }
-            for name, el in self.elements.items()
-        }
-        self.group.sync_canvas()
-        self.group.draw_preview()
-        self.parent.push_history()
+            self.group.fields = list(self.group.field_pos.keys())
+            self.group.conditions = list(self.conditions)
+            self.group.field_conf = {
+                name: {
+                    "width": el.width / self.scale,
+                    "height": el.height / self.scale,
+                    "font_size": el.font_size / self.scale,
+                    "bold": el.bold,
+                    "text_color": el.text_color,
+                    "bg_color": el.bg_color,
+                    "bg_visible": el.bg_visible,
+                    "align": el.align,
+                    "auto_font": el.auto_font,
+                    "layer": el.layer,
+                }
+                for name, el in self.elements.items()
+            }
+            with self.group.batch_updates():
+                self.group.sync_canvas()
+                self.group.draw_preview()
+            self.parent.push_history()
         self.group.editor = None
+        if self._restack_after is not None:
+            self.after_cancel(self._restack_after)
+        if self._scale_after is not None:
+            self.after_cancel(self._scale_after)
         self.destroy()
 
     def ctrl_zoom(self, event=None, factor=None):
         if factor is None:
             factor = 1.1 if event.delta > 0 else 0.9
-        new_scale = self.scale * factor
+        # wheel ticks build on each other before anything redraws
+        self.request_scale(self._target_scale * factor)
+
+    def request_scale(self, new_scale):
+        """Zoom to ``new_scale`` once Tk is idle.
+
+        A fast wheel scroll fires many events per frame; only the last
+        requested scale is applied, with a single rescale and grid redraw.
+        """
         if new_scale <= 0:
             return
-        factor = new_scale / self.scale
+        self._target_scale = new_scale
+        if self._scale_after is None:
+            self._scale_after = self.after_idle(self._flush_scale)
+
+    def _flush_scale(self):
+        self._scale_after = None
+        self.set_scale(self._target_scale)
+
+    def set_scale(self, new_scale):
+        self._target_scale = new_scale
+        # products of zoom factors pick up float noise in the last bits;
+        # rounding the applied scale (not the target later steps build on)
+        # keeps repeated zooms on the same scales and grid cache keys
+        new_scale = round(new_scale, 4)
+        old_scale = self.scale
+        base_w, base_h = self.base_width, self.base_height
+        # a change that moves nothing by half a pixel is not worth a redraw;
+        # the target stays, so further zoom steps still add up to one
+        if abs(new_scale - old_scale) * max(base_w, base_h) < 0.5:
+            return
+        factor = new_scale / old_scale
         for el in self.elements.values():
-            el.x *= factor
-            el.y *= factor
-            el.width *= factor
-            el.height *= factor
-            el.font_size *= factor
-            el.sync_canvas()
-            el.apply_font()
+            el.rescale(factor)
         self.scale = new_scale
-        self.snap_step = self.grid_size * self.scale
-        self.width = int(round(self.base_width * self.scale))
-        self.height = int(round(self.base_height * self.scale))
-        self.canvas.config(
-            width=self.width,
-            height=self.height,
-            scrollregion=(0, 0, self.width, self.height),
-        )
+        self.snap_step = self.grid_size * new_scale
+        width = int(round(base_w * new_scale))
+        height = int(round(base_h * new_scale))
+        if (width, height) != (self.width, self.height):
+            self.width = width
+            self.height = height
+            self.canvas.config(
+                width=width,
+                height=height,
+                scrollregion=(0, 0, width, height),
+            )
         self.draw_grid()
         if self.selected_element:
-            self.font_size_var.set(str(int(self.selected_element.font_size / self.scale)))
+            # the font follows the zoom, so the shown size rarely changes and
+            # rewriting the variable would only redraw the entry
+            text = str(int(self.selected_element.font_size / new_scale))
+            if self.font_size_var.get() != text:
+                self.font_size_var.set(text)
+
+    def _on_container_resize(self, event):
+        self._container_size = (event.width, event.height)
 
     def fit_to_window(self):
-        container_w = self.canvas_container.winfo_width()
-        container_h = self.canvas_container.winfo_height()
+        container_w, container_h = self._container_size
         if container_w <= 0 or container_h <= 0:
             return
         new_scale = min(container_w / self.base_width, container_h / self.base_height)
-        self.ctrl_zoom(factor=new_scale / self.scale)
+        self.request_scale(new_scale)
 # ---------------------------------------------------------------------------
 # GUI Application
 # ---------------------------------------------------------------------------
@@ -49,6 +49,19 @@ def _release_lock(path):
             logger.exception("Failed to remove lock %s", path)
 
 
+def _write_if_changed(path, data):
+    """Write ``data`` to ``path`` unless the file already holds those bytes."""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 def save_config(app):
     if not app.excel_path:
         messagebox.showerror("Błąd", "Najpierw wybierz plik Excel")
@@ -81,16 +94,15 @@ def save_config(app):
         if not lock:
             return
         app.config_lock_path = lock
+    data = json.dumps(config, ensure_ascii=False, indent=2).encode("utf-8")
     try:
-        with open(cfg_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        _write_if_changed(cfg_path, data)
     except OSError:
         logger.exception("Failed to save config to %s", cfg_path)
         messagebox.showerror("Błąd", f"Nie można zapisać konfiguracji do {cfg_path}")
     _ensure_config_dir()
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        _write_if_changed(CONFIG_FILE, data)
     except OSError:
         logger.exception("Failed to save backup config to %s", CONFIG_FILE)
     messagebox.showinfo("Zapisano", f"Zapisano konfigurację do {cfg_path}")
@@ -129,9 +141,10 @@ def load_config(app, startup=False, path=None):
     app.config_lock_path = lock
 
     try:
-        with open(cfg_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
-    except (OSError, json.JSONDecodeError):
+        with open(cfg_path, "rb") as f:
+            data = f.read()
+        config = json.loads(data.decode("utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
         logger.exception("Failed to load config from %s", cfg_path)
         _release_lock(lock)
         app.config_lock_path = None
@@ -147,7 +160,7 @@ def load_config(app, startup=False, path=None):
     if cfg_path != CONFIG_FILE:
         _ensure_config_dir()
         try:
-            shutil.copy(cfg_path, CONFIG_FILE)
+            _write_if_changed(CONFIG_FILE, data)
         except OSError:
             logger.exception("Failed to update backup config from %s", cfg_path)
 
@@ -160,6 +173,7 @@ def load_config(app, startup=False, path=None):
                 return
         app.excel_path = excel_cfg
         app.image_cache = {}
+        app.image_index = None
         app.path_var.set(excel_cfg)
         app.load_excel(excel_cfg)
     if path and excel_cfg and excel_cfg != path:
@@ -240,5 +254,5 @@ def load_config(app, startup=False, path=None):
         app.groups[group.name] = group
         if hasattr(app, "groups_list"):
             app.groups_list.insert("end", group.name)
-    app.restack_elements()
+    app.request_restack()
     app.push_history()
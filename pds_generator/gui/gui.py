@@ -1,7 +1,10 @@
 import logging
 import os
 import sys
+import threading
 import webbrowser
+from contextlib import contextmanager
+from queue import Empty, Queue
 
 import pandas as pd
 import tkinter as tk
@@ -9,7 +12,7 @@ from tkinter import ttk, filedialog, messagebox, colorchooser
 from tkinter import font as tkfont
 from PIL import Image, ImageTk
 
-from ..elements import DraggableElement
+from ..elements import DraggableElement, GuideIndex, MotionThrottle, stack_by_layer
 from ..groups import GroupArea, GroupEditor
 
 from .ui_layout import setup_ui as build_ui
@@ -24,14 +27,28 @@ from .config_io import (
 
 from ..github_utils import (
     get_repo_info,
-    get_remote_commit_info,
-    get_remote_version,
+    get_remote_info,
     pull_updates,
     get_version,
 )
 
 logger = logging.getLogger(__name__)
 
+
+def _share_unchanged(confs, previous):
+    """Swap dicts in ``confs`` for equal ones (by name) from ``previous``.
+
+    Consecutive history snapshots then share every element or group the
+    step did not touch, so each snapshot only costs memory for its changes.
+    """
+    earlier = {conf["name"]: conf for conf in previous}
+    for i, conf in enumerate(confs):
+        old = earlier.get(conf["name"])
+        if old == conf:
+            confs[i] = old
+    return confs
+
+
 class PDSGeneratorGUI(tk.Tk):
     PAGE_SIZES = {
         "A4": (595, 842),  # 210 x 297 mm in points
@@ -39,6 +56,8 @@ class PDSGeneratorGUI(tk.Tk):
     }
 
     grid_size = 5
+    # quiet period (ms) after which typed changes become one undo step
+    history_delay = 400
 
     DEFAULT_STATIC_FIELDS = ["Data", "Naglowek", "Stopka"]
 
@@ -67,14 +86,23 @@ class PDSGeneratorGUI(tk.Tk):
         self.groups = {}
         self.conditions = []
         self.image_cache = {}
+        # lowercased file name -> path for the Excel folder tree, built lazily
+        self.image_index = None
         self.excel_lock_path = None
         self.config_lock_path = None
         self.selected_elements = []
         self.selected_element = None
         self.sel_rect = None
         self.sel_start = None
+        self._select_throttle = MotionThrottle(self, self._drag_select_to)
         self.align_line_h = None
         self.align_line_v = None
+        self._guide_index = None
+        # size last applied to the canvas, to skip reconfiguring it unchanged
+        self._canvas_size = None
+        self._scrollregion = None
+        # zoom and page size the page, grid and rulers were last drawn for
+        self._grid_key = None
         self.page_width, self.page_height = self.PAGE_SIZES["A4"]
         self.scale = 1.0
         self.max_scale = 4.0
@@ -83,6 +111,16 @@ class PDSGeneratorGUI(tk.Tk):
         self.snap_step = self.grid_size * self.scale
         self.history = []
         self.future = []
+        self._history_after = None
+        self._history_depth = 0
+        self._history_pending = False
+        self._restack_after = None
+        # wheel zoom target and pointer position applied once per burst
+        self._pending_zoom = None
+        self._zoom_anchor = None
+        self._zoom_after = None
+        # bumped whenever an element or group changes its geometry
+        self.geometry_version = 0
         self.ignore_updates = False
         self.update_test = False
         self.update_available = False
@@ -94,8 +132,11 @@ class PDSGeneratorGUI(tk.Tk):
         self.bind_all("<Control-x>", self.redo)
         self.update_idletasks()
         self.resize_canvas()
-        self.load_config(startup=True)
+        # the GitHub requests overlap with loading the config and Excel file;
+        # their result is applied from the event loop, once the config has
+        # set the update preferences
         self.check_for_updates()
+        self.load_config(startup=True)
         if not self.history:
             self.push_history()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -106,22 +147,38 @@ class PDSGeneratorGUI(tk.Tk):
 
     # ------------------------------------------------------------------
     def check_for_updates(self):
-        local_hash, owner, repo = get_repo_info(self.repo_dir)
-        self.repo_owner, self.repo_name = owner, repo
+        """Look for a newer version without blocking the window.
+
+        The GitHub requests run on a worker thread while the editor finishes
+        loading; the worker only queues its result, which the Tk thread picks
+        up by polling.
+        """
+        results = Queue()
+
+        def worker():
+            local_hash, owner, repo = get_repo_info(self.repo_dir)
+            remote = get_remote_info(owner, repo)
+            results.put((local_hash, owner, repo, *remote))
+
+        def poll():
+            try:
+                info = results.get_nowait()
+            except Empty:
+                self.after(100, poll)
+            else:
+                self._apply_update_info(*info)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.after(100, poll)
 
-        remote_hash = None
-        remote_date = None
-        remote_version = None
+    def _apply_update_info(
+        self, local_hash, owner, repo, remote_hash, remote_date, remote_version
+    ):
+        self.repo_owner, self.repo_name = owner, repo
         if local_hash:
-            remote_hash, remote_date = get_remote_commit_info(owner, repo)
             self.update_available = bool(remote_hash and remote_hash != local_hash)
-            if self.update_available:
-                remote_version = get_remote_version(owner, repo)
         else:
-            remote_version = get_remote_version(owner, repo)
             self.update_available = bool(remote_version and remote_version != self.version)
-            if self.update_available:
-                _, remote_date = get_remote_commit_info(owner, repo)
 
         self.remote_version = remote_version
         self.remote_date = remote_date
@@ -221,6 +278,7 @@ class PDSGeneratorGUI(tk.Tk):
             self.path_var.set(path)
             self.excel_path = path
             self.image_cache = {}
+            self.image_index = None
             self.load_excel(path)
             self.load_config(path=path)
 
@@ -266,17 +324,24 @@ class PDSGeneratorGUI(tk.Tk):
             if os.path.exists(candidate):
                 path = candidate
             else:
-                path = None
-                for root, _, files in os.walk(base_dir):
-                    for f in files:
-                        if f.lower() == key:
-                            path = os.path.join(root, f)
-                            break
-                    if path:
-                        break
+                path = self._image_file_index(base_dir).get(key)
         self.image_cache[key] = path
         return path
 
+    def _image_file_index(self, base_dir):
+        """Map lowercased file names under ``base_dir`` to their paths.
+
+        The tree is walked once per Excel file instead of once per missing
+        image; the first match in walk order wins, as the old search did.
+        """
+        if self.image_index is None:
+            index = {}
+            for root, _, files in os.walk(base_dir):
+                for f in files:
+                    index.setdefault(f.lower(), os.path.join(root, f))
+            self.image_index = index
+        return self.image_index
+
     # ------------------------------------------------------------------
     def update_canvas_size(self):
         value = self.size_var.get().strip()
@@ -292,29 +357,20 @@ class PDSGeneratorGUI(tk.Tk):
         factor_w = size[0] / self.page_width
         factor_h = size[1] / self.page_height
         self.page_width, self.page_height = size
+        step = self.snap_step
         for el in self.elements.values():
-            el.x *= factor_w
-            el.y *= factor_h
-            el.width *= factor_w
-            el.height *= factor_h
+            el.x = round(el.x * factor_w / step) * step
+            el.y = round(el.y * factor_h / step) * step
+            el.width = max(step, round(el.width * factor_w / step) * step)
+            el.height = max(step, round(el.height * factor_h / step) * step)
             el.font_size *= factor_h
-            step = self.snap_step
-            el.x = round(el.x / step) * step
-            el.y = round(el.y / step) * step
-            el.width = max(step, round(el.width / step) * step)
-            el.height = max(step, round(el.height / step) * step)
+            # also applies (or refits) the font
             el.sync_canvas()
-            el.apply_font()
         for group in self.groups.values():
-            group.x *= factor_w
-            group.y *= factor_h
-            group.width *= factor_w
-            group.height *= factor_h
-            step = self.snap_step
-            group.x = round(group.x / step) * step
-            group.y = round(group.y / step) * step
-            group.width = max(step, round(group.width / step) * step)
-            group.height = max(step, round(group.height / step) * step)
+            group.x = round(group.x * factor_w / step) * step
+            group.y = round(group.y * factor_h / step) * step
+            group.width = max(step, round(group.width * factor_w / step) * step)
+            group.height = max(step, round(group.height * factor_h / step) * step)
             group.sync_canvas()
         self.resize_canvas()
 
@@ -324,7 +380,7 @@ class PDSGeneratorGUI(tk.Tk):
             if name not in self.elements:
                 element = DraggableElement(self, self.canvas, name, name)
                 self.elements[name] = element
-                self.restack_elements()
+                self.request_restack()
         else:
             self.remove_element(name)
         self.push_history()
@@ -335,7 +391,7 @@ class PDSGeneratorGUI(tk.Tk):
             if name not in self.elements:
                 element = DraggableElement(self, self.canvas, name, value)
                 self.elements[name] = element
-                self.restack_elements()
+                self.request_restack()
             else:
                 self.elements[name].update_value(value)
         else:
@@ -345,7 +401,8 @@ class PDSGeneratorGUI(tk.Tk):
     def update_static_value(self, name):
         if name in self.elements:
             self.elements[name].update_value(self.static_entries[name].get())
-            self.push_history()
+            # record one undo step per typing pause rather than per keystroke
+            self.schedule_history()
 
     def display_name(self, name):
         """Return field name including its current text value for lists."""
@@ -358,6 +415,19 @@ class PDSGeneratorGUI(tk.Tk):
             return f"{name}: {el.text}"
         return name
 
+    def display_names(self, names):
+        """Return ``display_name`` for every entry of ``names`` in one pass."""
+        static_entries = self.static_entries
+        elements = self.elements
+        labels = []
+        for name in names:
+            var = static_entries.get(name)
+            text = var.get() if var is not None else ""
+            if not text:
+                text = getattr(elements.get(name), "text", "")
+            labels.append(f"{name}: {text}" if text else name)
+        return labels
+
     def create_static_row(self, name, value=None):
         row = ttk.Frame(self.static_frame)
         if hasattr(self, "add_static_btn"):
@@ -397,10 +467,7 @@ class PDSGeneratorGUI(tk.Tk):
     def remove_element(self, name):
         element = self.elements.pop(name, None)
         if element:
-            for item in (element.rect, element.label, element.handle):
-                self.canvas.delete(item)
-            if hasattr(element, "image_id"):
-                self.canvas.delete(element.image_id)
+            element.destroy()
             if element in self.selected_elements:
                 self.selected_elements.remove(element)
             if self.selected_element is element:
@@ -409,9 +476,17 @@ class PDSGeneratorGUI(tk.Tk):
                 self.font_size_var.set("")
                 self.layer_entry.configure(state="disabled")
                 self.layer_var.set("")
-        self.restack_elements()
+        self.request_restack()
+
+    def request_restack(self):
+        """Restack once after the current burst of element updates."""
+        if self._restack_after is None:
+            self._restack_after = self.after_idle(self.restack_elements)
 
     def restack_elements(self):
+        if self._restack_after is not None:
+            self.after_cancel(self._restack_after)
+            self._restack_after = None
         if not self.elements:
             return
         min_layer = min(el.layer for el in self.elements.values())
@@ -419,25 +494,58 @@ class PDSGeneratorGUI(tk.Tk):
             shift = 1 - min_layer
             for el in self.elements.values():
                 el.layer += shift
-        for el in sorted(self.elements.values(), key=lambda e: e.layer):
-            for item in filter(None, [
-                el.rect,
-                el.label,
-                getattr(el, "image_id", None),
-                el.handle,
-            ]):
-                self.canvas.tag_raise(item)
-        self.canvas.tag_lower("page")
-        self.canvas.tag_lower("grid")
-        self.canvas.tag_raise("grid", "page")
+        if stack_by_layer(self.canvas, self.elements.values()):
+            self.canvas.tag_lower("page")
+            self.canvas.tag_lower("grid")
+            self.canvas.tag_raise("grid", "page")
         if self.selected_element:
             self.layer_var.set(str(int(self.selected_element.layer)))
         
+    def schedule_history(self):
+        """Record history once no further change arrives for a short while."""
+        if self._history_after is not None:
+            self.after_cancel(self._history_after)
+        self._history_after = self.after(self.history_delay, self.push_history)
+
+    def flush_history(self):
+        """Record a scheduled history step immediately."""
+        if self._history_after is not None:
+            self.push_history()
+
+    @contextmanager
+    def batch_history(self):
+        """Record a single history step for all changes made in the block.
+
+        ``push_history`` calls inside the block (also nested ones) are
+        collapsed into one snapshot taken when the outermost block exits.
+        """
+        self._history_depth += 1
+        try:
+            yield
+        finally:
+            self._history_depth -= 1
+            if not self._history_depth and self._history_pending:
+                self._history_pending = False
+                self.push_history()
+
     def push_history(self):
+        if self._history_after is not None:
+            self.after_cancel(self._history_after)
+            self._history_after = None
+        if self._history_depth:
+            self._history_pending = True
+            return
         state = {
             "elements": [el.to_dict() for el in self.elements.values()],
             "groups": [g.to_dict() for g in self.groups.values()],
         }
+        if self.history:
+            last = self.history[-1]
+            # e.g. a click that moved nothing: no undo step, redo kept
+            if state == last:
+                return
+            _share_unchanged(state["elements"], last["elements"])
+            _share_unchanged(state["groups"], last["groups"])
         self.history.append(state)
         if len(self.history) > 50:
             self.history.pop(0)
@@ -468,14 +576,13 @@ class PDSGeneratorGUI(tk.Tk):
             el.layer = conf.get("layer", el.layer)
             el.sync_canvas()
 
-        self.restack_elements()
+        self.request_restack()
 
         # restore groups
         current_groups = list(self.groups.keys())
         for name in current_groups:
             grp = self.groups.pop(name)
-            for item in (grp.rect, grp.handle) + tuple(grp.preview_items):
-                self.canvas.delete(item)
+            grp.destroy()
         self.groups = {}
         for gconf in state.get("groups", []):
             group = GroupArea(self, self.canvas, gconf.get("name", "Group"))
@@ -512,6 +619,7 @@ class PDSGeneratorGUI(tk.Tk):
                 self.groups_list.insert("end", name)
 
     def undo(self, event=None):
+        self.flush_history()
         if len(self.history) < 2:
             return
         state = self.history.pop()
@@ -519,6 +627,7 @@ class PDSGeneratorGUI(tk.Tk):
         self.restore_state(self.history[-1])
 
     def redo(self, event=None):
+        self.flush_history()
         if not self.future:
             return
         state = self.future.pop()
@@ -551,10 +660,7 @@ class PDSGeneratorGUI(tk.Tk):
         name = self.groups_list.get(sel[0])
         group = self.groups.pop(name, None)
         if group:
-            self.canvas.delete(group.rect)
-            self.canvas.delete(group.handle)
-            for item in getattr(group, "preview_items", []):
-                self.canvas.delete(item)
+            group.destroy()
         self.groups_list.delete(sel[0])
         self.push_history()
 
@@ -587,6 +693,10 @@ class PDSGeneratorGUI(tk.Tk):
                 self.conditions.pop(idx)
         ttk.Button(win, text="Usuń zaznaczone", command=remove).grid(row=4, column=0, columnspan=2, pady=5)
 
+    def geometry_changed(self):
+        """Invalidate the cached contents of all groups."""
+        self.geometry_version += 1
+
     def element_in_group(self, el, group):
         return (
             el.x >= group.x
@@ -607,13 +717,18 @@ class PDSGeneratorGUI(tk.Tk):
         except ValueError:
             messagebox.showerror("Błąd", "Nieprawidłowy numer wiersza")
             return
+        # one row Series per sheet, shared by all of its columns' elements
+        rows = {}
         for name, element in sorted(self.elements.items(), key=lambda kv: kv[1].layer):
             if ":" in name:
                 sheet, col = name.split(":", 1)
-                df = self.dataframes.get(sheet)
-                value = None
-                if df is not None and 0 <= idx < len(df):
-                    value = df.iloc[idx].get(col)
+                if sheet not in rows:
+                    df = self.dataframes.get(sheet)
+                    rows[sheet] = (
+                        df.iloc[idx] if df is not None and 0 <= idx < len(df) else None
+                    )
+                row = rows[sheet]
+                value = row.get(col) if row is not None else None
             else:
                 value = self.static_entries[name].get() if name in getattr(self, "static_entries", {}) else name
             element.update_value(value)
@@ -629,6 +744,17 @@ class PDSGeneratorGUI(tk.Tk):
         export_pds(self)
 
     # ------------------------------------------------------------------
+    def _size_canvas(self, width, height):
+        """Give the canvas ``width`` x ``height`` unless it already has it.
+
+        Changing the size makes Tk propagate geometry and fire <Configure>,
+        which a zoom inside an unchanged window does not need.
+        """
+        if (width, height) == self._canvas_size:
+            return
+        self._canvas_size = (width, height)
+        self.canvas.config(width=width, height=height)
+
     def resize_canvas(self, event=None):
         container_w = self.canvas_container.winfo_width()
         container_h = self.canvas_container.winfo_height()
@@ -638,11 +764,21 @@ class PDSGeneratorGUI(tk.Tk):
         if self.scale < self.min_scale:
             self.fit_to_window()
         else:
-            self.canvas.config(width=container_w, height=container_h)
+            self._size_canvas(container_w, container_h)
             self.draw_grid()
             self.center_page()
 
     def draw_grid(self):
+        """Draw the page, its snapping grid and the rulers.
+
+        Window resizes call this without changing the zoom or page size, so
+        the items are only rebuilt when one of those changed; the grid lines
+        are line items, whose count does not grow with the zoom.
+        """
+        key = (self.scale, self.page_width, self.page_height, self.grid_size)
+        if key == self._grid_key:
+            return
+        self._grid_key = key
         self.canvas.delete("grid")
         self.canvas.delete("page")
         self.canvas.delete("ruler")
@@ -652,16 +788,18 @@ class PDSGeneratorGUI(tk.Tk):
         h = self.page_height * self.scale
         # keep only a small constant margin so the page can be panned
         # slightly without introducing large grey areas around it
-        self.canvas_container.update_idletasks()
         self.margin = 20
-        self.canvas.configure(
-            scrollregion=(
-                -self.margin - 20,
-                -self.margin - 20,
-                w + self.margin + 20,
-                h + self.margin + 20,
-            )
+        region = (
+            -self.margin - 20,
+            -self.margin - 20,
+            w + self.margin + 20,
+            h + self.margin + 20,
         )
+        # window resizes redraw the grid without changing the page size;
+        # setting the same region again would only refresh the scrollbars
+        if region != self._scrollregion:
+            self._scrollregion = region
+            self.canvas.configure(scrollregion=region)
         self.canvas.create_rectangle(0, 0, w, h, fill="white", outline="", tags="page")
         # draw rulers background
         self.canvas.create_rectangle(0, -20, w, 0, fill="#e0e0e0", outline="black", tags="ruler")
@@ -692,46 +830,45 @@ class PDSGeneratorGUI(tk.Tk):
                 self.canvas.delete(line)
         self.align_line_h = self.align_line_v = None
 
+    def _guide_candidates(self, element):
+        return [el for el in list(self.elements.values()) + list(self.groups.values()) if el is not element]
+
+    def prepare_alignment_guides(self, element, moving=()):
+        """Index the edges ``element`` can snap to for the coming drag.
+
+        Items in ``moving`` travel together with ``element``; their distance
+        to it never changes, so they are not snap targets.
+        """
+        moving = set(moving)
+        others = [el for el in self._guide_candidates(element) if el not in moving]
+        self._guide_index = (element, GuideIndex(others))
+
+    def end_alignment_guides(self):
+        self._guide_index = None
+        self.clear_alignment_guides()
+
     def update_alignment_guides(self, element, resize=False):
         self.clear_alignment_guides()
-        others = [
-            el
-            for el in list(self.elements.values()) + list(self.groups.values())
-            if el is not element
-        ]
+        if self._guide_index and self._guide_index[0] is element:
+            index = self._guide_index[1]
+        else:
+            index = GuideIndex(self._guide_candidates(element))
         x1, y1 = element.x, element.y
         x2, y2 = element.x + element.width, element.y + element.height
         tol = 5
         snap_dx = snap_dy = 0
-        for other in others:
-            ox1, oy1 = other.x, other.y
-            ox2, oy2 = other.x + other.width, other.y + other.height
-            if not self.align_line_v:
-                edges = [x2] if resize else [x1, x2]
-                for x in edges:
-                    for ox in (ox1, ox2):
-                        if abs(x - ox) <= tol:
-                            snap_dx = ox - x
-                            self.align_line_v = self.canvas.create_line(
-                                ox, min(y1, oy1), ox, max(y2, oy2), fill="red"
-                            )
-                            break
-                    if self.align_line_v:
-                        break
-            if not self.align_line_h:
-                edges = [y2] if resize else [y1, y2]
-                for y in edges:
-                    for oy in (oy1, oy2):
-                        if abs(y - oy) <= tol:
-                            snap_dy = oy - y
-                            self.align_line_h = self.canvas.create_line(
-                                min(x1, ox1), oy, max(x2, ox2), oy, fill="red"
-                            )
-                            break
-                    if self.align_line_h:
-                        break
-            if self.align_line_h and self.align_line_v:
-                break
+        match = index.match_x([x2] if resize else [x1, x2], tol)
+        if match:
+            snap_dx, ox, other = match
+            self.align_line_v = self.canvas.create_line(
+                ox, min(y1, other.y), ox, max(y2, other.y + other.height), fill="red"
+            )
+        match = index.match_y([y2] if resize else [y1, y2], tol)
+        if match:
+            snap_dy, oy, other = match
+            self.align_line_h = self.canvas.create_line(
+                min(x1, other.x), oy, max(x2, other.x + other.width), oy, fill="red"
+            )
         self.zoom_var.set(f"{int(self.scale*100)}%")
         return snap_dx, snap_dy
 
@@ -751,49 +888,52 @@ class PDSGeneratorGUI(tk.Tk):
         top = max(0, min(top, total_h - container_h))
         self.canvas.xview_moveto(left / total_w)
         self.canvas.yview_moveto(top / total_h)
-    def ctrl_zoom(self, event, delta=None):
-        if delta is None:
-            delta = event.delta
-        factor = 1.1 if delta > 0 else 0.9
-        new_scale = self.scale * factor
-        new_scale = max(self.min_scale, min(self.max_scale, new_scale))
+    def _rescale_items(self, new_scale):
+        """Scale all elements and groups from ``self.scale`` to ``new_scale``."""
         factor = new_scale / self.scale
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
         for el in self.elements.values():
-            rel_x = el.x / self.scale
-            rel_y = el.y / self.scale
-            rel_w = el.width / self.scale
-            rel_h = el.height / self.scale
-            rel_f = el.font_size / self.scale
-            el.x = rel_x * new_scale
-            el.y = rel_y * new_scale
-            el.width = rel_w * new_scale
-            el.height = rel_h * new_scale
-            el.font_size = rel_f * new_scale
-            el.sync_canvas()
-            el.apply_font()
+            el.rescale(factor)
+        self.geometry_changed()
         for group in self.groups.values():
-            rel_x = group.x / self.scale
-            rel_y = group.y / self.scale
-            rel_w = group.width / self.scale
-            rel_h = group.height / self.scale
-            group.x = rel_x * new_scale
-            group.y = rel_y * new_scale
-            group.width = rel_w * new_scale
-            group.height = rel_h * new_scale
+            group.x *= factor
+            group.y *= factor
+            group.width *= factor
+            group.height *= factor
             group.sync_canvas()
         self.scale = new_scale
-        container_w = self.canvas_container.winfo_width()
-        container_h = self.canvas_container.winfo_height()
-        self.canvas.config(width=container_w, height=container_h)
+
+    def ctrl_zoom(self, event, delta=None):
+        """Zoom around the pointer; a burst of wheel steps redraws once."""
+        if delta is None:
+            delta = event.delta
+        factor = 1.1 if delta > 0 else 0.9
+        scale = self._pending_zoom if self._pending_zoom is not None else self.scale
+        self._pending_zoom = max(self.min_scale, min(self.max_scale, scale * factor))
+        self._zoom_anchor = (event.x, event.y)
+        if self._zoom_after is None:
+            self._zoom_after = self.after_idle(self._flush_zoom)
+
+    def _flush_zoom(self):
+        self._zoom_after = None
+        new_scale = self._pending_zoom
+        self._pending_zoom = None
+        if new_scale is None:
+            return
+        event_x, event_y = self._zoom_anchor
+        factor = new_scale / self.scale
+        x = self.canvas.canvasx(event_x)
+        y = self.canvas.canvasy(event_y)
+        self._rescale_items(new_scale)
+        self._size_canvas(
+            self.canvas_container.winfo_width(), self.canvas_container.winfo_height()
+        )
         self.draw_grid()
         w = self.page_width * self.scale
         h = self.page_height * self.scale
         total_w = w + 2 * (self.margin + 20)
         total_h = h + 2 * (self.margin + 20)
-        self.canvas.xview_moveto((x * factor - event.x + self.margin + 20) / total_w)
-        self.canvas.yview_moveto((y * factor - event.y + self.margin + 20) / total_h)
+        self.canvas.xview_moveto((x * factor - event_x + self.margin + 20) / total_w)
+        self.canvas.yview_moveto((y * factor - event_y + self.margin + 20) / total_h)
 
     def fit_to_window(self):
         container_w = self.canvas_container.winfo_width()
@@ -802,37 +942,20 @@ class PDSGeneratorGUI(tk.Tk):
             return
         new_scale = min(container_w / self.page_width, container_h / self.page_height)
         new_scale = max(self.min_scale, min(self.max_scale, new_scale))
-        for el in self.elements.values():
-            rel_x = el.x / self.scale
-            rel_y = el.y / self.scale
-            rel_w = el.width / self.scale
-            rel_h = el.height / self.scale
-            rel_f = el.font_size / self.scale
-            el.x = rel_x * new_scale
-            el.y = rel_y * new_scale
-            el.width = rel_w * new_scale
-            el.height = rel_h * new_scale
-            el.font_size = rel_f * new_scale
-            el.sync_canvas()
-            el.apply_font()
-        for group in self.groups.values():
-            rel_x = group.x / self.scale
-            rel_y = group.y / self.scale
-            rel_w = group.width / self.scale
-            rel_h = group.height / self.scale
-            group.x = rel_x * new_scale
-            group.y = rel_y * new_scale
-            group.width = rel_w * new_scale
-            group.height = rel_h * new_scale
-            group.sync_canvas()
-        self.scale = new_scale
-        container_w = self.canvas_container.winfo_width()
-        container_h = self.canvas_container.winfo_height()
-        self.canvas.config(width=container_w, height=container_h)
+        # a wheel zoom still waiting to be applied would undo the fit
+        self._pending_zoom = None
+        self._rescale_items(new_scale)
+        self._size_canvas(
+            self.canvas_container.winfo_width(), self.canvas_container.winfo_height()
+        )
         self.draw_grid()
         self.after_idle(self.center_page)
         if self.selected_element:
-            self.font_size_var.set(str(int(self.selected_element.font_size / self.scale)))
+            # the font follows the zoom, so the shown size rarely changes and
+            # rewriting the variable would only redraw the entry
+            text = str(int(self.selected_element.font_size / self.scale))
+            if self.font_size_var.get() != text:
+                self.font_size_var.set(text)
 
     def start_pan(self, event):
         self.canvas.scan_mark(event.x, event.y)
@@ -866,12 +989,24 @@ class PDSGeneratorGUI(tk.Tk):
             self.layer_entry.configure(state="disabled")
             self.layer_var.set("")
 
+    def select_elements(self, elements):
+        """Add ``elements`` to the selection.
+
+        Same as ``select_element(el, additive=True)`` for each of them, but
+        the highlight and the toolbar are only refreshed once.
+        """
+        for el in elements:
+            if el not in self.selected_elements:
+                self.selected_elements.append(el)
+        if self.selected_elements:
+            self.select_element(self.selected_elements[-1], additive=True)
+
     def canvas_button_press(self, event):
         current = self.canvas.find_withtag("current")
         if current:
             item = current[0]
             for el in self.elements.values():
-                if item in (el.rect, el.label, el.handle, getattr(el, "image_id", None)):
+                if item in el.canvas_items:
                     return
             for group in self.groups.values():
                 if item in (group.rect, group.handle):
@@ -880,6 +1015,7 @@ class PDSGeneratorGUI(tk.Tk):
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
         self.sel_start = (x, y)
+        self._sel_pointer = (event.x, event.y)
         self.sel_rect = self.canvas.create_rectangle(
             x,
             y,
@@ -892,14 +1028,21 @@ class PDSGeneratorGUI(tk.Tk):
         self.canvas.tag_raise(self.sel_rect)
 
     def canvas_drag_select(self, event):
+        self._select_throttle(event)
+
+    def _drag_select_to(self, event):
         if not self.sel_start:
             return
+        if (event.x, event.y) == self._sel_pointer:
+            return  # stationary event, the rectangle would not change
+        self._sel_pointer = (event.x, event.y)
         x0, y0 = self.sel_start
         x1 = self.canvas.canvasx(event.x)
         y1 = self.canvas.canvasy(event.y)
         self.canvas.coords(self.sel_rect, x0, y0, x1, y1)
 
     def canvas_button_release(self, event):
+        self._select_throttle.flush()
         if not self.sel_start:
             if not self.canvas.find_withtag("current"):
                 self.select_element(None)
@@ -915,10 +1058,17 @@ class PDSGeneratorGUI(tk.Tk):
         if y0 > y1:
             y0, y1 = y1, y0
         self.select_element(None)
-        for el in self.elements.values():
-            ex0, ey0, ex1, ey1 = self.canvas.coords(el.rect)
-            if ex0 >= x0 and ex1 <= x1 and ey0 >= y0 and ey1 <= y1:
-                self.select_element(el, additive=True)
+        # the element geometry mirrors its rectangle, no need to ask Tk
+        self.select_elements(
+            [
+                el
+                for el in self.elements.values()
+                if el.x >= x0
+                and el.x + el.width <= x1
+                and el.y >= y0
+                and el.y + el.height <= y1
+            ]
+        )
 
     def toggle_bold(self):
         el = self.selected_element
@@ -974,7 +1124,7 @@ class PDSGeneratorGUI(tk.Tk):
         if layer < 1:
             layer = 1
         el.layer = layer
-        self.restack_elements()
+        self.request_restack()
         self.push_history()
         self.layer_var.set(str(int(el.layer)))
 
@@ -3,20 +3,35 @@ import os
 import time
 import threading
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from itertools import islice
 from types import SimpleNamespace
 
 import pandas as pd
-import requests
 from PIL import Image
 from reportlab.pdfgen import canvas as pdf_canvas
 from reportlab.lib.utils import ImageReader
 from reportlab.lib import colors
-import tkinter as tk
 from tkinter import messagebox
 
+from ..groups import stack_columns
+
 logger = logging.getLogger(__name__)
 
+_INVALID_FILENAME_CHARS = re.compile(r"[^\w\s-]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Decoded images kept per export run; most PDS files reuse a handful of logos
+# and product photos, while a cap keeps catalogues of unique photos in check.
+IMAGE_READER_CACHE_SIZE = 64
+
+# Remote images are downloaded by this many threads, at most this many URLs
+# ahead of the row being drawn (bounding the bytes held in memory).
+PREFETCH_WORKERS = 8
+PREFETCH_AHEAD = 32
+
 
 def to_reportlab_color(value):
     try:
@@ -26,22 +41,148 @@ def to_reportlab_color(value):
 
 
 def sanitize_filename(name: str) -> str:
-    cleaned = re.sub(r"[^\w\s-]", "", str(name))
-    cleaned = re.sub(r"\s+", "_", cleaned).strip("_")
+    cleaned = _INVALID_FILENAME_CHARS.sub("", str(name))
+    cleaned = _WHITESPACE.sub("_", cleaned).strip("_")
     return cleaned
 
 
-def draw_pdf_element(app, c, element, value, x, y):
+class RemoteImagePrefetcher:
+    """Download remote images ahead of the rows that draw them.
+
+    ``urls`` maps each unique image URL to the first row using it, in row
+    order. Downloads share one keep-alive ``requests.Session`` and run on a
+    small thread pool, keeping ``PREFETCH_AHEAD`` URLs in flight; ``fetch``
+    hands out the downloaded bytes and tops the window up again.
+
+    Not every queued URL is drawn (conditions hide fields, empty group
+    fields are skipped), so ``start_row`` drops the URLs of finished rows
+    instead of letting them hold window slots and bodies for the whole run.
+    Within a row the URLs may be fetched in any order.
+    """
+
+    def __init__(self, urls):
+        import requests
+
+        self._session = requests.Session()
+        self._pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+        self._rows = urls
+        self._urls = iter(urls)
+        # URLs first used before this row are no longer downloaded
+        self._floor = 0
+        self._futures = {}
+        self._fill()
+
+    def _fill(self):
+        while len(self._futures) < PREFETCH_AHEAD:
+            url = next(self._urls, None)
+            if url is None:
+                return
+            if self._rows[url] < self._floor:
+                continue
+            self._futures[url] = self._pool.submit(self._get, url)
+
+    def _get(self, url):
+        resp = self._session.get(url, timeout=5)
+        # error pages are not images; let the caller's RequestException
+        # handling deal with them
+        resp.raise_for_status()
+        return resp.content
+
+    def start_row(self, row):
+        """Drop the downloads still queued for rows before ``row``."""
+        self._floor = row
+        for queued in list(self._futures):
+            if self._rows[queued] >= row:
+                break
+            self._futures.pop(queued).cancel()
+        self._fill()
+
+    def fetch(self, url):
+        """Return the body of ``url``, downloading it now if not prefetched."""
+        future = self._futures.pop(url, None)
+        self._fill()
+        if future is None:
+            # e.g. an image dropped from the reader cache and needed again
+            return self._get(url)
+        return future.result()
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
+
+def _remote_image_urls(fixed, columns, total_rows):
+    """Map the ``http`` values of an export to the first row using them.
+
+    ``fixed`` holds the values shared by all rows (first used by row 0),
+    ``columns`` one list of cell values per exported column.
+    """
+    urls = {}
+    for value in fixed:
+        if isinstance(value, str) and value.lower().startswith("http"):
+            urls.setdefault(value, 0)
+    rows = {}
+    # columns differ in length when sheets do, so each is scanned on its own
+    for column in columns:
+        for row, value in enumerate(islice(column, total_rows)):
+            if isinstance(value, str) and value.lower().startswith("http"):
+                if row < rows.get(value, total_rows):
+                    rows[value] = row
+    # the prefetcher downloads in insertion order, which must follow the rows
+    for value, row in sorted(rows.items(), key=lambda item: item[1]):
+        urls.setdefault(value, row)
+    return urls
+
+
+def _image_reader(cache, key, load):
+    """Return the ``ImageReader`` for ``key`` from ``cache``, decoding it on a miss.
+
+    ``cache`` is the ``OrderedDict`` of one export run. ``load`` returns the
+    PIL image; errors it raises propagate uncached. The least recently used
+    reader is dropped when the cache is full, so images drawn on every row
+    stay cached.
+    """
+    reader = cache.get(key)
+    if reader is None:
+        reader = ImageReader(load())
+        if len(cache) >= IMAGE_READER_CACHE_SIZE:
+            cache.popitem(last=False)
+        cache[key] = reader
+    else:
+        cache.move_to_end(key)
+    return reader
+
+
+def draw_pdf_element(app, c, element, value, x, y, readers=None, prefetcher=None):
+    """Draw ``value`` for ``element`` on the PDF canvas ``c``.
+
+    ``readers`` is the image reader cache of the export run; without one the
+    images are decoded for this call only. ``prefetcher`` is the run's
+    ``RemoteImagePrefetcher``; without one remote images are downloaded here.
+    """
+    if readers is None:
+        readers = OrderedDict()
+    width = element.width / app.scale
+    height = element.height / app.scale
     if isinstance(value, str) and value.lower().startswith("http"):
+        import requests
+
+        def download():
+            if prefetcher is not None:
+                content = prefetcher.fetch(value)
+            else:
+                resp = requests.get(value, timeout=5)
+                resp.raise_for_status()
+                content = resp.content
+            return Image.open(BytesIO(content))
+
         try:
-            resp = requests.get(value, timeout=5)
-            img = Image.open(BytesIO(resp.content))
             c.drawImage(
-                ImageReader(img),
+                _image_reader(readers, value, download),
                 x,
                 y,
-                width=element.width / app.scale,
-                height=element.height / app.scale,
+                width=width,
+                height=height,
             )
             return
         except (requests.RequestException, OSError):
@@ -50,46 +191,32 @@ def draw_pdf_element(app, c, element, value, x, y):
         local_path = app.find_local_image(value)
         if local_path:
             try:
-                img = Image.open(local_path)
                 c.drawImage(
-                    ImageReader(img),
+                    _image_reader(readers, local_path, lambda: Image.open(local_path)),
                     x,
                     y,
-                    width=element.width / app.scale,
-                    height=element.height / app.scale,
+                    width=width,
+                    height=height,
                 )
                 return
             except OSError:
                 logger.exception("Failed to load local image %s", local_path)
     if element.bg_visible:
         c.setFillColor(to_reportlab_color(element.bg_color))
-        c.rect(
-            x,
-            y,
-            element.width / app.scale,
-            element.height / app.scale,
-            fill=1,
-            stroke=0,
-        )
+        c.rect(x, y, width, height, fill=1, stroke=0)
     c.setFillColor(to_reportlab_color(element.text_color))
     c.setFont(
         "Helvetica-Bold" if element.bold else "Helvetica",
         element.font_size / app.scale,
     )
+    text = str(value)
+    mid_y = y + height / 2
     if element.align == "center":
-        c.drawCentredString(
-            x + (element.width / app.scale) / 2,
-            y + (element.height / app.scale) / 2,
-            str(value),
-        )
+        c.drawCentredString(x + width / 2, mid_y, text)
     elif element.align == "right":
-        c.drawRightString(
-            x + (element.width / app.scale),
-            y + (element.height / app.scale) / 2,
-            str(value),
-        )
+        c.drawRightString(x + width, mid_y, text)
     else:
-        c.drawString(x, y + (element.height / app.scale) / 2, str(value))
+        c.drawString(x, mid_y, text)
 
 
 def generate_pds(app):
@@ -107,29 +234,57 @@ def generate_pds(app):
     page_width = app.page_width
     page_height = app.page_height
 
+    needed = set(app.elements.keys())
+    for g in app.groups.values():
+        needed.update(g.fields)
+    needed.update(app.static_entries.keys())
+    # each exported column becomes a plain list with blanks for missing
+    # cells, so rows index lists instead of building a pandas row per field;
+    # values that do not change between rows are read once
+    columns = {}
+    fixed = {}
+    for name in needed:
+        if ":" in name:
+            sheet, col = name.split(":", 1)
+            df = app.dataframes.get(sheet)
+            if df is not None and col in df.columns:
+                column = df[col].astype(object)
+                columns[name] = column.where(column.notna(), "").tolist()
+            else:
+                fixed[name] = ""
+        else:
+            var = app.static_entries.get(name)
+            value = var.get() if var is not None else ""
+            fixed[name] = "" if pd.isna(value) else value
+    first_column = first_df.iloc[:, 0].tolist() if first_df.shape[1] else None
+
     def worker():
         start_time = time.time()
+        # per run, as images may have been edited since the last one; a
+        # second export started meanwhile gets its own cache
+        readers = OrderedDict()
+        prefetcher = RemoteImagePrefetcher(
+            _remote_image_urls(fixed.values(), columns.values(), total_rows)
+        )
+        try:
+            render_rows(start_time, readers, prefetcher)
+        finally:
+            prefetcher.close()
+        app.progress.after(0, lambda: app.progress.config(value=0))
+        app.time_label.after(0, lambda: app.time_label.config(text="Zakończono"))
+        messagebox.showinfo("Zakończono", f"Pliki zapisane w {output_dir}")
+
+    def render_rows(start_time, readers, prefetcher):
         for idx in range(total_rows):
-            first_val = first_df.iloc[idx, 0] if first_df.shape[1] else ""
+            prefetcher.start_row(idx)
+            first_val = first_column[idx] if first_column is not None else ""
             filename = sanitize_filename(first_val) or f"pds_{idx+1}"
             pdf_path = os.path.join(output_dir, f"{filename}.pdf")
             tmp_path = pdf_path + ".tmp"
             c = pdf_canvas.Canvas(tmp_path, pagesize=(page_width, page_height))
-            needed = set(app.elements.keys())
-            for g in app.groups.values():
-                needed.update(g.fields)
-            needed.update(app.static_entries.keys())
-            values = {}
-            for name in needed:
-                if ":" in name:
-                    sheet, col = name.split(":", 1)
-                    df = app.dataframes.get(sheet)
-                    value = df.iloc[idx].get(col, "") if df is not None else ""
-                else:
-                    value = app.static_entries.get(name, tk.StringVar()).get()
-                if pd.isna(value):
-                    value = ""
-                values[name] = value
+            values = dict(fixed)
+            for name, column in columns.items():
+                values[name] = column[idx] if idx < len(column) else ""
             group_field_names = {fname for g in app.groups.values() for fname in g.fields}
 
             hidden = set()
@@ -146,7 +301,7 @@ def generate_pds(app):
                     if pd.isna(values.get(src)) or values.get(src) == "":
                         g_hidden.add(tgt)
                 positions = group.field_pos
-                columns = {}
+                group_columns = {}
                 for fname in group.fields:
                     if fname in hidden or fname in g_hidden:
                         continue
@@ -160,54 +315,32 @@ def generate_pds(app):
                     width = conf.get("width", el.width if el else 0)
                     height = conf.get("height", el.height if el else 0)
                     x0, y0 = positions.get(fname, (0, 0))
-                    columns.setdefault(x0, []).append((y0, fname, width, height, conf, el, val))
-
-                placed = []
-                for x0 in sorted(columns):
-                    col_items = columns[x0]
-                    col_items.sort(key=lambda t: t[0])
-                    cur_y = 0
-                    for _, fname, width, height, conf, el, val in col_items:
-                        y = cur_y
-                        while True:
-                            overlap = False
-                            for px, py, pw, ph in placed:
-                                if (
-                                    x0 < px + pw
-                                    and x0 + width > px
-                                    and y < py + ph
-                                    and y + height > py
-                                ):
-                                    y = py + ph
-                                    overlap = True
-                                    break
-                            if not overlap:
-                                break
-                        if y + height > group.height:
-                            continue
-                        dummy = SimpleNamespace(
-                            width=width,
-                            height=height,
-                            font_size=conf.get("font_size", el.font_size if el else 12),
-                            bold=conf.get("bold", el.bold if el else False),
-                            text_color=conf.get("text_color", el.text_color if el else "black"),
-                            bg_color=conf.get("bg_color", el.bg_color if el else "white"),
-                            bg_visible=conf.get("bg_visible", el.bg_visible if el else True),
-                            align=conf.get("align", el.align if el else "left"),
-                            auto_font=conf.get("auto_font", el.auto_font if el else True),
-                        )
-                        x_pdf = (group.x + x0) / app.scale
-                        y_pdf = page_height - (group.y + y + height) / app.scale
-                        draw_pdf_element(app, c, dummy, val, x_pdf, y_pdf)
-                        placed.append((x0, y, width, height))
-                        cur_y = y + height
+                    group_columns.setdefault(x0, []).append((y0, width, height, (fname, conf, el, val)))
+
+                for x0, y, width, height, (fname, conf, el, val) in stack_columns(
+                    group_columns, group.height
+                ):
+                    dummy = SimpleNamespace(
+                        width=width,
+                        height=height,
+                        font_size=conf.get("font_size", el.font_size if el else 12),
+                        bold=conf.get("bold", el.bold if el else False),
+                        text_color=conf.get("text_color", el.text_color if el else "black"),
+                        bg_color=conf.get("bg_color", el.bg_color if el else "white"),
+                        bg_visible=conf.get("bg_visible", el.bg_visible if el else True),
+                        align=conf.get("align", el.align if el else "left"),
+                        auto_font=conf.get("auto_font", el.auto_font if el else True),
+                    )
+                    x_pdf = (group.x + x0) / app.scale
+                    y_pdf = page_height - (group.y + y + height) / app.scale
+                    draw_pdf_element(app, c, dummy, val, x_pdf, y_pdf, readers, prefetcher)
             for name, element in sorted(app.elements.items(), key=lambda kv: kv[1].layer):
                 if name in hidden:
                     continue
                 val = values.get(name, "")
                 x = element.x / app.scale
                 y = page_height - (element.y / app.scale) - (element.height / app.scale)
-                draw_pdf_element(app, c, element, val, x, y)
+                draw_pdf_element(app, c, element, val, x, y, readers, prefetcher)
             c.showPage()
             c.save()
             try:
@@ -226,8 +359,5 @@ def generate_pds(app):
             remaining = (elapsed / (idx + 1)) * (total_rows - idx - 1)
             app.progress.after(0, lambda p=progress: app.progress.config(value=p))
             app.time_label.after(0, lambda r=remaining: app.time_label.config(text=f"Pozostały czas: {int(r)} s"))
-        app.progress.after(0, lambda: app.progress.config(value=0))
-        app.time_label.after(0, lambda: app.time_label.config(text="Zakończono"))
-        messagebox.showinfo("Zakończono", f"Pliki zapisane w {output_dir}")
 
     threading.Thread(target=worker, daemon=True).start()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -24,6 +25,52 @@ def _parse_requirements(path: Path) -> Iterable[str]:
             yield line
 
 
+def _normalize(name: str) -> str:
+    # PEP 503: ``Pillow``, ``pillow`` and ``python_dateutil``/``python-dateutil``
+    # name the same distribution
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _is_satisfied(req: str, installed: dict[str, str]) -> bool:
+    """Return whether the requirement line ``req`` is already met.
+
+    When the ``packaging`` distribution is installed, version specifiers and
+    environment markers are honoured. It is not guaranteed to be present (pip
+    only vendors its own private copy), so without it only the distribution
+    name is compared.
+    """
+    try:
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        name = re.split(r"[\s\[<>=!~;@]", req, maxsplit=1)[0]
+        return _normalize(name) in installed
+    try:
+        parsed = Requirement(req)
+    except InvalidRequirement:
+        # let pip report the malformed line
+        return False
+    if parsed.marker is not None and not parsed.marker.evaluate():
+        return True
+    version = installed.get(_normalize(parsed.name))
+    if version is None:
+        return False
+    return not parsed.specifier or parsed.specifier.contains(version, prereleases=True)
+
+
+def _pip_install(packages: list[str]) -> None:
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            *packages,
+        ]
+    )
+
+
 def install_missing_requirements(requirements_file: str = "requirements.txt") -> None:
     """Install packages listed in ``requirements_file`` if they are missing."""
     path = Path(requirements_file)
@@ -32,15 +79,14 @@ def install_missing_requirements(requirements_file: str = "requirements.txt") ->
         return
 
     installed = {
-        dist.metadata["Name"].lower()
+        _normalize(dist.metadata["Name"]): dist.version
         for dist in metadata.distributions()
         if dist.metadata.get("Name")
     }
-    missing = []
-    for req in _parse_requirements(path):
-        pkg_name = req.split("==")[0].lower()
-        if pkg_name not in installed:
-            missing.append(req)
+    # pip is only started for requirements that are not met yet
+    missing = [
+        req for req in _parse_requirements(path) if not _is_satisfied(req, installed)
+    ]
 
     if not missing:
         return
@@ -59,12 +105,24 @@ def install_missing_requirements(requirements_file: str = "requirements.txt") ->
     updates: Queue[str | None] = Queue()
 
     def worker() -> None:
-        for pkg in missing:
-            updates.put(pkg)
-            try:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
-            except Exception as err:  # pragma: no cover - best effort logging
-                logger.error("Failed to install %s: %s", pkg, err)
+        # A single pip run resolves and downloads everything at once instead of
+        # paying interpreter start-up and resolver passes once per package.
+        updates.put(", ".join(missing))
+        try:
+            _pip_install(missing)
+        except Exception as err:  # pragma: no cover - best effort logging
+            if len(missing) == 1:
+                logger.error("Failed to install %s: %s", missing[0], err)
+            else:
+                # one bad requirement fails the whole run; retry one by one
+                # so the others still get installed and failures are named
+                logger.warning("Failed to install %s: %s", ", ".join(missing), err)
+                for pkg in missing:
+                    updates.put(pkg)
+                    try:
+                        _pip_install([pkg])
+                    except Exception as pkg_err:  # pragma: no cover - best effort logging
+                        logger.error("Failed to install %s: %s", pkg, pkg_err)
         updates.put(None)
 
     threading.Thread(target=worker, daemon=True).start()
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+from pds_generator.groups import GroupEditor
+
+GRID = 1
+ELEMENT = 2
+
+
+class _Canvas:
+    """Reports ``current`` as the item under the pointer, like Tk does."""
+
+    def __init__(self, current):
+        self.current = current
+        self.created = []
+
+    def find_withtag(self, tag):
+        assert tag == "current"
+        return (self.current,) if self.current else ()
+
+    def canvasx(self, x):
+        return x
+
+    def canvasy(self, y):
+        return y
+
+    def create_rectangle(self, *coords, **_options):
+        self.created.append(coords)
+        return 99
+
+    def tag_raise(self, _item):
+        pass
+
+
+def _editor(current):
+    editor = object.__new__(GroupEditor)
+    editor.canvas = _Canvas(current)
+    editor._grid_item = GRID
+    editor.sel_start = None
+    editor.deselected = 0
+
+    def select_element(element):
+        assert element is None
+        editor.deselected += 1
+
+    editor.select_element = select_element
+    editor._select_throttle = SimpleNamespace(flush=lambda: None)
+    return editor
+
+
+def test_press_on_the_grid_starts_a_rubber_band():
+    editor = _editor(GRID)
+    editor.canvas_button_press(SimpleNamespace(x=5, y=7))
+    assert editor.sel_start == (5, 7)
+    assert editor.canvas.created == [(5, 7, 5, 7)]
+
+
+def test_press_on_an_element_leaves_selection_to_the_element():
+    editor = _editor(ELEMENT)
+    editor.canvas_button_press(SimpleNamespace(x=5, y=7))
+    assert editor.sel_start is None
+    assert editor.deselected == 0
+
+
+def test_release_on_the_grid_deselects():
+    editor = _editor(GRID)
+    editor.canvas_button_release(SimpleNamespace(x=5, y=7))
+    assert editor.deselected == 1
+
+
+def _zoom_editor(base_width, base_height):
+    editor = object.__new__(GroupEditor)
+    editor.__dict__.update(
+        scale=1.0,
+        _target_scale=1.0,
+        _scale_after=None,
+        base_width=base_width,
+        base_height=base_height,
+        width=base_width,
+        height=base_height,
+        grid_size=10,
+        elements={},
+        selected_element=None,
+        canvas=SimpleNamespace(config=lambda **_options: None),
+    )
+    editor.draw_grid = lambda: None
+    editor.after_idle = lambda callback: callback()
+    return editor
+
+
+def test_zoom_steps_add_up_on_small_groups():
+    editor = _zoom_editor(4, 3)
+    editor.ctrl_zoom(factor=1.1)
+    # moves nothing by half a pixel yet
+    assert editor.scale == 1.0
+    editor.ctrl_zoom(factor=1.1)
+    assert editor.scale == 1.21
+
+
+def test_zoom_applies_rounded_scales():
+    editor = _zoom_editor(400, 300)
+    for _ in range(3):
+        editor.ctrl_zoom(factor=1.1)
+    assert editor.scale == 1.331
+    assert editor._target_scale == 1.1 * 1.1 * 1.1
@@ -0,0 +1,160 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("reportlab")
+pytest.importorskip("PIL")
+
+from pds_generator.gui import pdf_export
+
+
+class _Widget:
+    def after(self, _delay, callback):
+        callback()
+
+    def config(self, **_kwargs):
+        pass
+
+
+class _Thread:
+    """Run the export worker inline so the test can inspect its output."""
+
+    def __init__(self, target, daemon=None):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+def _element(**overrides):
+    conf = dict(
+        x=10,
+        y=10,
+        width=100,
+        height=20,
+        font_size=12,
+        bold=False,
+        text_color="black",
+        bg_color="white",
+        bg_visible=True,
+        align="left",
+        auto_font=True,
+        layer=1,
+    )
+    conf.update(overrides)
+    return SimpleNamespace(**conf)
+
+
+def test_generate_pds_writes_one_pdf_per_row(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_export.threading, "Thread", _Thread)
+    monkeypatch.setattr(pdf_export.messagebox, "showinfo", lambda *a: None)
+    df = pd.DataFrame({"Nazwa": ["A1", "B2"], "Cena": [10, None]})
+    group = SimpleNamespace(
+        fields=["Arkusz:Cena"],
+        field_pos={"Arkusz:Cena": (0, 0)},
+        field_conf={"Arkusz:Cena": {"width": 50, "height": 20}},
+        conditions=[],
+        x=0,
+        y=100,
+        height=200,
+    )
+    app = SimpleNamespace(
+        excel_path=str(tmp_path / "dane.xlsx"),
+        dataframes={"Arkusz": df},
+        page_width=595,
+        page_height=842,
+        scale=1.0,
+        elements={"Arkusz:Nazwa": _element()},
+        groups={"G": group},
+        static_entries={},
+        conditions=[],
+        progress=_Widget(),
+        time_label=_Widget(),
+        find_local_image=lambda value: None,
+    )
+
+    pdf_export.generate_pds(app)
+
+    written = sorted(os.listdir(tmp_path / "PDS"))
+    assert written == ["A1.pdf", "B2.pdf"]
+
+
+def test_prefetcher_serves_a_row_in_any_order(monkeypatch):
+    pytest.importorskip("requests")
+    downloaded = []
+
+    def get(self, url):
+        downloaded.append(url)
+        return url.encode()
+
+    monkeypatch.setattr(pdf_export.RemoteImagePrefetcher, "_get", get)
+    urls = pdf_export._remote_image_urls(
+        [], [["http://a0", "http://a1"], ["http://b0", "http://b1"]], 2
+    )
+    assert urls == {"http://a0": 0, "http://b0": 0, "http://a1": 1, "http://b1": 1}
+    prefetcher = pdf_export.RemoteImagePrefetcher(urls)
+    try:
+        for row in range(2):
+            prefetcher.start_row(row)
+            # the export draws group fields and elements by layer, which
+            # need not follow the column order
+            for url in (f"http://b{row}", f"http://a{row}"):
+                assert prefetcher.fetch(url) == url.encode()
+    finally:
+        prefetcher.close()
+    assert sorted(downloaded) == sorted(urls)
+
+
+def test_remote_image_urls_reads_columns_of_longer_sheets():
+    urls = pdf_export._remote_image_urls(
+        ["http://logo"], [["http://a0"], ["", "http://b1", "http://b2"]], 3
+    )
+    assert list(urls.items()) == [
+        ("http://logo", 0),
+        ("http://a0", 0),
+        ("http://b1", 1),
+        ("http://b2", 2),
+    ]
+
+
+def test_prefetcher_drops_urls_of_finished_rows(monkeypatch):
+    pytest.importorskip("requests")
+    monkeypatch.setattr(pdf_export, "PREFETCH_AHEAD", 2)
+    downloaded = []
+
+    def get(self, url):
+        downloaded.append(url)
+        return url.encode()
+
+    monkeypatch.setattr(pdf_export.RemoteImagePrefetcher, "_get", get)
+    prefetcher = pdf_export.RemoteImagePrefetcher(
+        {"http://a": 0, "http://b": 1, "http://c": 2, "http://d": 3, "http://e": 4}
+    )
+    try:
+        # rows 0-2 drew no images (e.g. hidden by a condition)
+        prefetcher.start_row(3)
+        assert list(prefetcher._futures) == ["http://d", "http://e"]
+        assert prefetcher.fetch("http://d") == b"http://d"
+        assert "http://c" not in downloaded
+    finally:
+        prefetcher.close()
+
+
+def test_image_reader_keeps_images_used_on_every_row(monkeypatch):
+    monkeypatch.setattr(pdf_export, "IMAGE_READER_CACHE_SIZE", 2)
+    cache = pdf_export.OrderedDict()
+    loads = []
+
+    def load(name):
+        def image():
+            loads.append(name)
+            return pdf_export.Image.new("RGB", (1, 1))
+
+        return image
+
+    for photo in ("photo1", "photo2", "photo3"):
+        pdf_export._image_reader(cache, "logo", load("logo"))
+        pdf_export._image_reader(cache, photo, load(photo))
+    assert loads == ["logo", "photo1", "photo2", "photo3"]